@@ -0,0 +1,13 @@
+-- Index author_name_variants on LOWER(variant_name).
+--
+-- The CSV importers resolve a name by matching it against both
+-- `authors.normalized_name` (already indexed) and `LOWER(variant_name)`.
+-- Without an expression index the variant side is a sequential scan per
+-- lookup.
+--
+-- `authors.normalized_name` deliberately stays non-unique: distinct people can
+-- share a normalized name, and true duplicates are merged by
+-- tools/dedup_authors.py rather than rejected at insert time.
+
+CREATE INDEX IF NOT EXISTS idx_author_variants_lower_variant_name
+    ON author_name_variants(LOWER(variant_name));
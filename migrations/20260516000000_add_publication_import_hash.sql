@@ -0,0 +1,14 @@
+-- Digest of the CSV row a publication was last imported from.
+--
+-- tools/scrapers/talks/importer.py stores it on insert/update and skips a
+-- talk whose row hashes the same on re-import, leaving the publication and
+-- its authorships untouched. Rows inserted by anything else start NULL,
+-- which the importer always treats as changed. Nothing else clears it:
+-- after an API edit of an imported publication or its authorships, a
+-- re-import of the same CSV row does not restore the CSV values. Set
+-- import_hash to NULL (or bump the importer's 'v1' prefix) to force that.
+
+ALTER TABLE publications ADD COLUMN import_hash BYTEA;
+
+COMMENT ON COLUMN publications.import_hash IS
+    'Talk CSV importer''s digest of the source row; unchanged rows are skipped on re-import. Not cleared by other writers: NULL it to force a re-import.';
@@ -3,18 +3,21 @@
 
 import argparse
 import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
 import asyncpg
-from bs4 import BeautifulSoup
+from asyncpg.prepared_stmt import PreparedStatement
+from bs4 import BeautifulSoup, Tag
 import aiohttp
 from dotenv import load_dotenv
 
@@ -25,6 +28,79 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Fetched archive pages, so re-runs don't re-download them
+CACHE_DIR = Path(__file__).parent / 'cache'
+
+# Titles are matched as whole tokens, ignoring case and trailing punctuation
+_TITLES = frozenset({'dr', 'prof', 'jr', 'sr', 'phd', 'ph.d', 'md', 'm.d'})
+
+# Section header patterns per committee type
+_SECTION_PATTERNS = {
+    'PC': ['program committee', 'pc members', 'programme committee'],
+    'OC': ['organizing committee', 'organising committee', 'local organizing committee',
+           'local organising committee', 'organization', 'organisers', 'organizers'],
+    'SC': ['steering committee', 'sc members']
+}
+_SECTION_RES = {
+    committee_type: re.compile('|'.join(map(re.escape, patterns)))
+    for committee_type, patterns in _SECTION_PATTERNS.items()
+}
+
+# Role indicators on structured member cards
+_ROLE_KEYWORD_RE = re.compile('chair|member|support')
+
+# Role hints in the part of an entry after the name
+_PAREN_ROLE_RE = re.compile('chair|member')
+_ROLE_HINT_RE = re.compile('chair|member|organizer')
+
+# Blacklist - only filter if the whole text is mostly blacklisted content
+_BLACKLIST_PRIMARY_RE = re.compile('|'.join(map(re.escape, [
+    'accepted papers', 'call for papers', 'code of conduct', 'charter',
+    'schedule', 'speakers', 'poster', 'pictures', 'sponsors', 'partners',
+    'proceedings', 'registration', 'venue', 'travel',
+    'accommodation', 'contact', 'about', 'home', 'news', 'archive',
+    'previous', 'next', 'program', 'tutorials', 'workshops',
+    'members only', 'login', 'logout', 'search',
+])))
+
+# Navigation items - filter more aggressively
+_BLACKLIST_NAV_RE = re.compile('|'.join(map(re.escape, [
+    'twitter', 'youtube', 'linkedin', 'facebook', 'instagram',
+    'steering committee', 'program committee', 'organizing committee',
+    'general chairs', 'program chairs', 'local arrangements',
+])))
+
+# Institutional keywords that mark the start of affiliation
+_INSTITUTION_KEYWORDS = frozenset({
+    'university', 'institute', 'college', 'laboratory', 'center', 'centre',
+    'school', 'department', 'lab', 'research', 'academy', 'national',
+    'ministry', 'agency', 'corporation', 'company', 'foundation', 'society',
+    'organization', 'organisation', 'consortium', 'jpmorgan', 'amazon',
+    'google', 'microsoft', 'ibm', 'aws', 'ntt', 'cesga', 'cnrs', 'inria',
+    'eth', 'mit', 'caltech', 'weizmann', 'fraunhofer', 'hhh', 'iis',
+})
+_LOCATION_PREFIXES = frozenset({
+    'new', 'york', 'hong', 'kong', 'san', 'los', 'tel', 'aviv', 'rio', 'cape', 'town', 'mexico', 'city',
+})
+_LOCATION_FIRST_WORDS = frozenset({'new', 'san', 'hong', 'tel', 'rio', 'cape'})
+
+# Position rules in priority order; the first rule whose phrase appears
+# anywhere in the text wins
+_POSITIONS = [
+    (('general chair', 'conference chair'), ('chair', 'General Chair')),
+    (('program chair', 'pc chair', 'pc primary chair'), ('chair', 'Program Chair')),
+    (('steering chair', 'sc chair'), ('chair', 'Steering Chair')),
+    (('local chair',), ('chair', 'Local Chair')),
+    (('co-chair', 'cochair', 'pc co-chair'), ('co_chair', None)),
+    (('area chair', 'senior pc'), ('area_chair', None)),
+    (('chair',), ('chair', None)),
+]
+# The lookahead tests every offset, so overlapping phrases (e.g. "pc chair"
+# inside "senior pc chair") are all seen, not just the leftmost match
+_POSITION_RE = re.compile('(?=' + '|'.join(
+    '(' + '|'.join(map(re.escape, phrases)) + ')' for phrases, _ in _POSITIONS
+) + ')')
+
 
 @dataclass
 class CommitteeMember:
@@ -47,14 +123,61 @@ class ConferenceToScrape:
     archive_steering_url: Optional[str] = None
 
 
+_FIND_AUTHORS_SQL = "SELECT normalized_name, id FROM authors WHERE normalized_name = ANY($1::text[])"
+
+# The metadata JSON is built server-side from values already being sent
+_INSERT_AUTHORS_SQL = """
+    INSERT INTO authors (id, full_name, normalized_name, affiliation, metadata, created_at, updated_at, creator, modifier)
+    SELECT id, full_name, normalized_name, affiliation,
+           CASE WHEN affiliation <> '' THEN jsonb_build_object('affiliation', affiliation) ELSE '{}' END,
+           $5, $5, 'scraper', 'scraper'
+    FROM unnest($1::uuid[], $2::text[], $3::text[], $4::text[])
+        AS t(id, full_name, normalized_name, affiliation)
+"""
+
+_UPSERT_ROLES_SQL = """
+    INSERT INTO committee_roles (id, conference_id, author_id, committee, position, metadata, created_at, updated_at, creator, modifier)
+    SELECT id, $1, author_id, committee::committee_type, position::committee_position,
+           CASE WHEN role_title <> '' THEN jsonb_build_object('role_title', role_title) ELSE '{}' END,
+           $7, $7, 'scraper', 'scraper'
+    FROM unnest($2::uuid[], $3::uuid[], $4::text[], $5::text[], $6::text[])
+        AS t(id, author_id, committee, position, role_title)
+    ON CONFLICT (conference_id, author_id, committee, position)
+    DO UPDATE SET metadata = EXCLUDED.metadata, updated_at = EXCLUDED.updated_at, modifier = 'scraper'
+"""
+
+
+@dataclass
+class InsertSession:
+    """A connection plus the insert statements, prepared once on it.
+    
+    Inserts are serialized, so a whole run goes through one session and the
+    server parses and plans each statement once. The session also remembers
+    author IDs it has already resolved, since the same people sit on
+    committees year after year.
+    """
+    conn: asyncpg.Connection
+    find_authors: PreparedStatement
+    insert_authors: PreparedStatement
+    upsert_roles: PreparedStatement
+    author_ids: Dict[str, UUID] = field(default_factory=dict)
+    
+    @classmethod
+    async def prepare(cls, conn: asyncpg.Connection) -> 'InsertSession':
+        """Prepare the statements on ``conn``."""
+        return cls(
+            conn=conn,
+            find_authors=await conn.prepare(_FIND_AUTHORS_SQL),
+            insert_authors=await conn.prepare(_INSERT_AUTHORS_SQL),
+            upsert_roles=await conn.prepare(_UPSERT_ROLES_SQL),
+        )
+
+
+@lru_cache(maxsize=8192)
 def normalize_name(name: str) -> str:
     """Normalize author name for matching."""
-    # Remove common prefixes/suffixes
-    name = re.sub(r'\b(Dr\.|Prof\.|Jr\.|Sr\.|Ph\.?D\.?|M\.?D\.?)\b', '', name, flags=re.IGNORECASE)
-    # Remove extra whitespace
-    name = ' '.join(name.split())
-    # Convert to lowercase for matching
-    return name.lower().strip()
+    # Remove common prefixes/suffixes, collapse whitespace and lowercase
+    return ' '.join(w for w in name.split() if w.lower().rstrip('.,') not in _TITLES).lower().strip()
 
 
 def get_local_dir(args: argparse.Namespace) -> Path:
@@ -131,6 +254,24 @@ async def get_conferences_to_scrape(
     ]
 
 
+async def check_author_lookup_plan(pool: asyncpg.Pool) -> None:
+    """Warn if author lookups by normalized name can't use an index.
+    
+    Sequential scans are disabled for the EXPLAIN only, so a Seq Scan in the
+    plan means no usable index exists, not that the table is small.
+    """
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute("SET LOCAL enable_seqscan = off")
+            plan = await conn.fetchval(f"EXPLAIN (FORMAT JSON) {_FIND_AUTHORS_SQL}", ['x'])
+    
+    if 'Seq Scan' in plan:
+        logger.warning(
+            "Author lookups by normalized_name will scan the whole authors table; "
+            "is idx_authors_normalized_name missing?"
+        )
+
+
 async def check_committee_exists(pool: asyncpg.Pool, conference_id: UUID) -> bool:
     """Check if committee data already exists for conference."""
     count = await pool.fetchval(
@@ -140,53 +281,98 @@ async def check_committee_exists(pool: asyncpg.Pool, conference_id: UUID) -> boo
     return count > 0
 
 
-async def scrape_committee_page(
+@lru_cache(maxsize=256)
+def load_local_soup(local_path: Path, mtime_ns: int) -> BeautifulSoup:
+    """Read and parse a local archive file, cached per path and modification time."""
+    return BeautifulSoup(local_path.read_text(encoding='utf-8', errors='ignore'), 'lxml')
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write ``text`` to a temporary name and rename it over ``path``, so a
+    concurrent fetch of the same URL never reads a partly written file."""
+    tmp_path = path.with_name(f"{path.name}.{uuid4().hex}.tmp")
+    tmp_path.write_text(text, encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+async def fetch_html(
     url: str,
     args: argparse.Namespace,
-    committee_type: str
-) -> List[CommitteeMember]:
-    """Scrape committee page and extract members."""
-    logger.info(f"Scraping {committee_type} from: {url}")
+    session: aiohttp.ClientSession
+) -> str:
+    """Fetch a page, caching the response on disk.
     
+    Archived pages don't change, so a cached copy is used as-is; with
+    --refresh-cache it is revalidated using the stored ETag/Last-Modified.
+    """
+    cache_path = CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()}.html"
+    validators_path = cache_path.with_suffix('.json')
+    cached = not args.no_cache and cache_path.exists()
+    
+    headers = {}
+    if cached:
+        if not args.refresh_cache:
+            return await asyncio.to_thread(cache_path.read_text, encoding='utf-8')
+        if validators_path.exists():
+            validators = json.loads(await asyncio.to_thread(validators_path.read_text))
+            if 'ETag' in validators:
+                headers['If-None-Match'] = validators['ETag']
+            if 'Last-Modified' in validators:
+                headers['If-Modified-Since'] = validators['Last-Modified']
+    
+    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
+        if cached and response.status == 304:
+            logger.info("Cached copy still current: %s", url)
+            return await asyncio.to_thread(cache_path.read_text, encoding='utf-8')
+        html_content = await response.text()
+        status = response.status
+        validators = {k: response.headers[k] for k in ('ETag', 'Last-Modified') if k in response.headers}
+    
+    if not args.no_cache and status == 200:
+        # Page first: validators next to an old page would make every later
+        # revalidation a 304 for the stale copy
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(_write_atomic, cache_path, html_content)
+        await asyncio.to_thread(_write_atomic, validators_path, json.dumps(validators))
+    
+    return html_content
+
+
+async def fetch_page(
+    url: str,
+    args: argparse.Namespace,
+    session: aiohttp.ClientSession
+) -> BeautifulSoup:
+    """Fetch and parse a committee page."""
     # Get HTML content
     if args.local:
         local_path = url_to_local_path(args, url)
-        logger.info(f"Reading local file: {local_path}")
+        logger.info("Reading local file: %s", local_path)
         
         if not local_path.exists():
             raise FileNotFoundError(f"Local file not found: {local_path}")
         
-        html_content = local_path.read_text(encoding='utf-8', errors='ignore')
-    else:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                html_content = await response.text()
-    
-    soup = BeautifulSoup(html_content, 'html.parser')
+        # Read and parse off the event loop; the same archived page is often
+        # listed for several committees and conferences
+        return await asyncio.to_thread(load_local_soup, local_path, local_path.stat().st_mtime_ns)
     
-    # Parse committee members
-    return parse_committee_members(soup, committee_type)
+    html_content = await fetch_html(url, args, session)
+    return BeautifulSoup(html_content, 'lxml')
 
 
 def parse_committee_members(soup: BeautifulSoup, committee_type: str) -> List[CommitteeMember]:
     """Parse committee members from HTML."""
     members = []
     
-    # Define section header patterns
-    section_patterns = {
-        'PC': ['program committee', 'pc members', 'programme committee'],
-        'OC': ['organizing committee', 'organising committee', 'local organizing committee',
-               'local organising committee', 'organization', 'organisers', 'organizers'],
-        'SC': ['steering committee', 'sc members']
-    }.get(committee_type, [])
-    
-    logger.info(f"Looking for section matching: {section_patterns}")
+    section_patterns = _SECTION_PATTERNS.get(committee_type, [])
+    logger.info("Looking for section matching: %s", section_patterns)
     
     # Try section-based parsing
-    section_members = parse_section_based(soup, section_patterns, committee_type)
-    if section_members:
-        logger.info(f"Found {len(section_members)} members using section-based parsing")
-        return section_members
+    if section_patterns:
+        section_members = parse_section_based(soup, _SECTION_RES[committee_type], committee_type)
+        if section_members:
+            logger.info("Found %d members using section-based parsing", len(section_members))
+            return section_members
     
     # Try specific selectors
     specific_selectors = [
@@ -197,7 +383,7 @@ def parse_committee_members(soup: BeautifulSoup, committee_type: str) -> List[Co
     for selector in specific_selectors:
         elements = soup.select(selector)
         if elements:
-            logger.info(f"Using specific selector: {selector} ({len(elements)} elements)")
+            logger.info("Using specific selector: %s (%d elements)", selector, len(elements))
             for element in elements:
                 text = element.get_text(' ', strip=True)
                 
@@ -237,35 +423,33 @@ def parse_committee_members(soup: BeautifulSoup, committee_type: str) -> List[Co
 
 def parse_section_based(
     soup: BeautifulSoup,
-    section_patterns: List[str],
+    section_re: re.Pattern,
     committee_type: str
 ) -> Optional[List[CommitteeMember]]:
     """Parse using heading-based sections."""
     headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+    levels = [int(h.name[1]) for h in headings]
     
     for idx, heading in enumerate(headings):
-        heading_text = heading.get_text().lower()
+        heading_text = heading.get_text()
         
         # Check if this heading matches any pattern
-        if any(pattern in heading_text for pattern in section_patterns):
-            logger.info(f"Found section header: '{heading.get_text().strip()}'")
+        if section_re.search(heading_text.lower()):
+            logger.info("Found section header: '%s'", heading_text.strip())
             
             # Find next heading at same or higher level
-            heading_level = int(heading.name[1])
-            next_heading = None
-            
-            for h in headings[idx + 1:]:
-                next_level = int(h.name[1])
-                if next_level <= heading_level:
-                    next_heading = h
-                    break
+            heading_level = levels[idx]
+            next_heading = next(
+                (headings[i] for i in range(idx + 1, len(headings)) if levels[i] <= heading_level),
+                None
+            )
             
             members = extract_members_between_headings(
                 soup, heading, next_heading, committee_type
             )
             
             if members:
-                logger.info(f"Found {len(members)} members using section-based parsing")
+                logger.info("Found %d members using section-based parsing", len(members))
                 return members
     
     return None
@@ -280,21 +464,15 @@ def extract_members_between_headings(
     """Extract members between two headings by traversing siblings."""
     members = []
     
-    # Start from the heading and iterate through siblings
-    current = start_heading
+    # Iterate through the element siblings after the heading; text nodes
+    # (whitespace between tags, mostly) are skipped up front
+    siblings = [el for el in start_heading.next_siblings if isinstance(el, Tag)]
     
-    while current:
-        # Get next sibling
-        current = current.next_sibling
-        
+    for current in siblings:
         # Stop if we reach the end heading
-        if current == end_heading:
+        if current is end_heading:
             break
         
-        # Skip text nodes
-        if not hasattr(current, 'name'):
-            continue
-        
         # Stop if we hit another h2 (major section boundary)
         if current.name == 'h2':
             break
@@ -317,19 +495,22 @@ def extract_members_between_headings(
                     # Try to extract structured data from HTML tags
                     label = li.find('div', class_='label')
                     if label:
+                        # One pass over the card collects both heading levels
+                        card_headings = label.find_all(['h3', 'h4'])
+                        
                         # Extract name from h3
-                        h3 = label.find('h3')
+                        h3 = next((h for h in card_headings if h.name == 'h3'), None)
                         name = h3.get_text(strip=True) if h3 else None
                         
                         # Extract affiliation and role from h4 tags
-                        h4_tags = label.find_all('h4')
+                        h4_tags = [h for h in card_headings if h.name == 'h4']
                         affiliation = None
                         role_text = ''
                         
                         for h4 in h4_tags:
                             h4_text = h4.get_text(strip=True)
                             # Role indicators usually contain these keywords
-                            if any(kw in h4_text.lower() for kw in ['chair', 'member', 'co-chair', 'area chair', 'support']):
+                            if _ROLE_KEYWORD_RE.search(h4_text.lower()):
                                 role_text = h4_text
                             elif not affiliation:  # First non-role h4 is likely affiliation
                                 affiliation = h4_text
@@ -373,36 +554,16 @@ def parse_member_entry(text: str, committee_type: str) -> Optional[CommitteeMemb
     """Parse a single member entry."""
     text_lower = text.lower()
     
-    # Blacklist - only filter if the whole text is mostly blacklisted content
-    blacklist_primary = [
-        'accepted papers', 'call for papers', 'code of conduct', 'charter',
-        'schedule', 'speakers', 'poster', 'pictures', 'sponsors', 'partners',
-        'proceedings', 'registration', 'venue', 'travel',
-        'accommodation', 'contact', 'about', 'home', 'news', 'archive',
-        'previous', 'next', 'program', 'tutorials', 'workshops',
-        'members only', 'login', 'logout', 'search',
-    ]
-    
-    # Navigation items - filter more aggressively
-    blacklist_nav = [
-        'twitter', 'youtube', 'linkedin', 'facebook', 'instagram',
-        'steering committee', 'program committee', 'organizing committee',
-        'general chairs', 'program chairs', 'local arrangements'
-    ]
-    
     # Check if this is just a navigation/header item (exact match or very short)
-    for item in blacklist_nav:
-        if item in text_lower and len(text) < 100:
-            # But allow if it looks like a person's entry (has capitalized words)
-            words = text.split()
-            if len(words) >= 2 and any(w[0].isupper() for w in words if w):
-                continue
+    if len(text) < 100 and _BLACKLIST_NAV_RE.search(text_lower):
+        # But allow if it looks like a person's entry (has capitalized words)
+        words = text.split()
+        if not (len(words) >= 2 and any(w[0].isupper() for w in words if w)):
             return None
     
     # Check for purely non-person content
-    for item in blacklist_primary:
-        if item == text_lower or (item in text_lower and len(text) < 30):
-            return None
+    if len(text) < 30 and _BLACKLIST_PRIMARY_RE.search(text_lower):
+        return None
     
     # Skip all caps or URLs
     if text.isupper() or 'http://' in text or 'https://' in text or 'www.' in text:
@@ -446,37 +607,25 @@ def extract_name_affiliation_role(text: str) -> Tuple[str, Optional[str], str]:
     affiliation = None
     role_info = ''
     
-    # Institutional keywords that mark the start of affiliation
-    institution_keywords = {
-        'university', 'institute', 'college', 'laboratory', 'center', 'centre',
-        'school', 'department', 'lab', 'research', 'academy', 'national',
-        'ministry', 'agency', 'corporation', 'company', 'foundation', 'society',
-        'organization', 'organisation', 'consortium', 'jpmorgan', 'amazon',
-        'google', 'microsoft', 'ibm', 'aws', 'ntt', 'cesga', 'cnrs', 'inria',
-        'eth', 'mit', 'caltech', 'weizmann', 'fraunhofer', 'hhh', 'iis'
-    }
-    
     # Pattern: "Name University/Company Site role"
     if ' Site ' in text:
-        parts = text.split(' Site ', 1)
-        before_site = parts[0]
-        after_site = parts[1] if len(parts) > 1 else ''
+        before_site, _, after_site = text.partition(' Site ')
         
         words = before_site.split()
+        lower_words = before_site.lower().split()
         
         # Find where affiliation starts (first institutional keyword)
         # Also handle cases like "New York University" where "New York" precedes the keyword
         affiliation_start = None
         for i in range(1, len(words)):  # Start from index 1 (at least one word for name)
-            if words[i].lower() in institution_keywords:
+            if lower_words[i] in _INSTITUTION_KEYWORDS:
                 affiliation_start = i
                 # Check if previous word(s) are common location/institution prefixes
                 if i > 2:  # At least 3 words before (name + location prefix)
-                    prev_word = words[i-1].lower()
-                    if prev_word in {'new', 'york', 'hong', 'kong', 'san', 'los', 'tel', 'aviv', 'rio', 'cape', 'town', 'mexico', 'city'}:
+                    if lower_words[i-1] in _LOCATION_PREFIXES:
                         affiliation_start = i - 1
                         # Handle two-word prefixes like "New York", "Hong Kong", "San Francisco"
-                        if i > 3 and words[i-2].lower() in {'new', 'san', 'hong', 'tel', 'rio', 'cape'}:
+                        if i > 3 and lower_words[i-2] in _LOCATION_FIRST_WORDS:
                             affiliation_start = i - 2
                 break
         
@@ -502,16 +651,15 @@ def extract_name_affiliation_role(text: str) -> Tuple[str, Optional[str], str]:
     
     # Pattern: "Name (Affiliation)"
     elif '(' in text and ')' in text:
-        parts = text.split('(', 1)
-        name = parts[0].strip()
+        name, _, rest = text.partition('(')
+        name = name.strip()
         
-        rest = parts[1]
         end_paren = rest.find(')')
         if end_paren != -1:
             in_parens = rest[:end_paren]
             
             # Check if it's a role or affiliation
-            if 'chair' in in_parens.lower() or 'member' in in_parens.lower():
+            if _PAREN_ROLE_RE.search(in_parens.lower()):
                 role_info = in_parens
             else:
                 affiliation = in_parens
@@ -523,26 +671,21 @@ def extract_name_affiliation_role(text: str) -> Tuple[str, Optional[str], str]:
     # Pattern: "Name - Affiliation"
     elif ' - ' in text or ' – ' in text:
         separator = ' - ' if ' - ' in text else ' – '
-        parts = text.split(separator, 1)
-        name = parts[0].strip()
-        
-        rest = parts[1] if len(parts) > 1 else ''
-        rest_lower = rest.lower()
+        name, _, rest = text.partition(separator)
+        name = name.strip()
         
-        if 'chair' in rest_lower or 'member' in rest_lower or 'organizer' in rest_lower:
+        if _ROLE_HINT_RE.search(rest.lower()):
             role_info = rest
         else:
             affiliation = rest
     
     # Pattern: "Name, Affiliation"
     elif ',' in text:
-        parts = text.split(',', 1)
-        name = parts[0].strip()
+        name, _, rest = text.partition(',')
+        name = name.strip()
+        rest = rest.strip()
         
-        rest = parts[1].strip() if len(parts) > 1 else ''
-        rest_lower = rest.lower()
-        
-        if 'chair' in rest_lower or 'member' in rest_lower or 'organizer' in rest_lower:
+        if _ROLE_HINT_RE.search(rest.lower()):
             role_info = rest
         else:
             affiliation = rest
@@ -559,22 +702,10 @@ def detect_position(name: str, full_text: str, role_info: str) -> Tuple[str, Opt
     """Detect position from text."""
     combined = f"{full_text} {role_info}".lower()
     
-    if 'general chair' in combined or 'conference chair' in combined:
-        return 'chair', 'General Chair'
-    elif 'program chair' in combined or 'pc chair' in combined or 'pc primary chair' in combined:
-        return 'chair', 'Program Chair'
-    elif 'steering chair' in combined or 'sc chair' in combined:
-        return 'chair', 'Steering Chair'
-    elif 'local chair' in combined:
-        return 'chair', 'Local Chair'
-    elif 'co-chair' in combined or 'cochair' in combined or 'pc co-chair' in combined:
-        return 'co_chair', None
-    elif 'area chair' in combined or 'senior pc' in combined:
-        return 'area_chair', None
-    elif 'chair' in combined:
-        return 'chair', None
-    else:
+    matched = {m.lastindex for m in _POSITION_RE.finditer(combined)}
+    if not matched:
         return 'member', None
+    return _POSITIONS[min(matched) - 1][1]
 
 
 def clean_name(name: str) -> str:
@@ -583,89 +714,175 @@ def clean_name(name: str) -> str:
 
 
 def deduplicate_members(members: List[CommitteeMember]) -> List[CommitteeMember]:
-    """Remove duplicate members."""
+    """Remove duplicate members, keeping the alphabetically first spelling."""
     seen = {}
-    result = []
     
-    for member in sorted(members, key=lambda m: m.name):
+    for member in members:
         normalized = normalize_name(member.name)
-        if normalized not in seen:
-            seen[normalized] = True
-            result.append(member)
+        kept = seen.get(normalized)
+        if kept is None or member.name < kept.name:
+            seen[normalized] = member
     
-    return result
+    return sorted(seen.values(), key=lambda m: m.name)
 
 
-async def get_or_create_author(
-    pool: asyncpg.Pool,
-    name: str,
-    affiliation: Optional[str]
-) -> UUID:
-    """Get or create author record."""
-    normalized = normalize_name(name)
+async def get_or_create_authors(
+    inserts: InsertSession,
+    members: List[CommitteeMember],
+    now: datetime
+) -> Dict[str, UUID]:
+    """Get or create author records, keyed by normalized name."""
+    names = {}
+    for member in members:
+        names.setdefault(normalize_name(member.name), member)
+    
+    # Authors seen earlier in the run need no lookup
+    author_ids = {normalized: inserts.author_ids[normalized] for normalized in names if normalized in inserts.author_ids}
     
     # Try to find existing
-    existing = await pool.fetchval(
-        "SELECT id FROM authors WHERE normalized_name = $1",
-        normalized
+    unknown = [normalized for normalized in names if normalized not in author_ids]
+    if unknown:
+        for row in await inserts.find_authors.fetch(unknown):
+            author_ids.setdefault(row['normalized_name'], row['id'])
+    
+    for normalized, author_id in author_ids.items():
+        logger.info("Found existing author: %s (%s)", names[normalized].name, author_id)
+    
+    # Create the rest in one statement
+    new_authors = [(normalized, member) for normalized, member in names.items() if normalized not in author_ids]
+    if not new_authors:
+        return author_ids
+    
+    ids = [uuid4() for _ in new_authors]
+    await inserts.insert_authors.fetch(
+        ids,
+        [member.name for _, member in new_authors],
+        [normalized for normalized, _ in new_authors],
+        [member.affiliation for _, member in new_authors],
+        now
     )
     
-    if existing:
-        logger.info(f"Found existing author: {name} ({existing})")
-        return existing
+    for author_id, (normalized, member) in zip(ids, new_authors):
+        author_ids[normalized] = author_id
+        logger.info("Created new author: %s (%s)", member.name, author_id)
     
-    # Create new
-    author_id = uuid4()
-    
-    metadata = {'affiliation': affiliation} if affiliation else {}
-    
-    await pool.execute(
-        """INSERT INTO authors (id, full_name, normalized_name, affiliation, metadata, created_at, updated_at, creator, modifier)
-           VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)""",
-        author_id, name, normalized, affiliation, json.dumps(metadata),
-        datetime.utcnow(), datetime.utcnow(), 'scraper', 'scraper'
-    )
-    
-    logger.info(f"Created new author: {name} ({author_id})")
-    return author_id
+    return author_ids
 
 
-async def insert_committee_role(
-    pool: asyncpg.Pool,
+async def insert_committee_roles(
+    inserts: InsertSession,
     conference_id: UUID,
-    author_id: UUID,
-    committee: str,
-    position: str,
-    role_title: Optional[str]
+    members: List[CommitteeMember],
+    author_ids: Dict[str, UUID],
+    now: datetime
 ) -> None:
-    """Insert committee role."""
-    role_id = uuid4()
-    metadata = {'role_title': role_title} if role_title else {}
-    
-    await pool.execute(
-        """INSERT INTO committee_roles (id, conference_id, author_id, committee, position, metadata, created_at, updated_at, creator, modifier)
-           VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-           ON CONFLICT (conference_id, author_id, committee, position) 
-           DO UPDATE SET metadata = EXCLUDED.metadata, updated_at = EXCLUDED.updated_at, modifier = 'scraper'""",
-        role_id, conference_id, author_id, committee, position,
-        json.dumps(metadata), datetime.utcnow(), datetime.utcnow(), 'scraper', 'scraper'
+    """Insert committee roles."""
+    # One row per role; a repeated role keeps the last entry's metadata
+    roles = {}
+    for member in members:
+        author_id = author_ids[normalize_name(member.name)]
+        roles[(author_id, member.committee, member.position)] = member.role_title
+    
+    await inserts.upsert_roles.fetch(
+        conference_id,
+        [uuid4() for _ in roles],
+        [author_id for author_id, _, _ in roles],
+        [committee for _, committee, _ in roles],
+        [position for _, _, position in roles],
+        list(roles.values()),
+        now
     )
 
 
 async def insert_committee_members(
-    pool: asyncpg.Pool,
+    inserts: InsertSession,
     conference_id: UUID,
     members: List[CommitteeMember]
 ) -> None:
-    """Insert all committee members."""
-    for member in members:
-        author_id = await get_or_create_author(pool, member.name, member.affiliation)
-        await insert_committee_role(
-            pool, conference_id, author_id,
-            member.committee, member.position, member.role_title
-        )
+    """Insert all committee members in a single transaction."""
+    now = datetime.utcnow()
+    async with inserts.conn.transaction():
+        author_ids = await get_or_create_authors(inserts, members, now)
+        await insert_committee_roles(inserts, conference_id, members, author_ids, now)
+    
+    # Only remember authors once they are committed
+    inserts.author_ids.update(author_ids)
     
-    logger.info(f"Inserted {len(members)} committee members")
+    logger.info("Inserted %d committee members", len(members))
+
+
+async def process_conference(
+    conf: ConferenceToScrape,
+    pool: asyncpg.Pool,
+    inserts: InsertSession,
+    session: aiohttp.ClientSession,
+    args: argparse.Namespace,
+    semaphore: asyncio.Semaphore,
+    insert_lock: asyncio.Lock
+) -> None:
+    """Scrape all committee pages of a conference and insert the members."""
+    async with semaphore:
+        logger.info("\n=== Processing %s %d ===", conf.venue, conf.year)
+        
+        # Check if should skip
+        if not args.force:
+            exists = await check_committee_exists(pool, conf.id)
+            if exists:
+                logger.info("Committee data already exists for %s %d. Use --force to re-scrape.", conf.venue, conf.year)
+                return
+        
+        committees = [
+            (committee_type, url)
+            for committee_type, url in (
+                ('PC', conf.archive_pc_url),
+                ('OC', conf.archive_organizers_url),
+                ('SC', conf.archive_steering_url),
+            )
+            if url
+        ]
+        
+        # Fetch each distinct page once, concurrently; the committees are
+        # often all listed on the same page
+        urls = list(dict.fromkeys(url for _, url in committees))
+        pages = await asyncio.gather(
+            *(fetch_page(url, args, session) for url in urls),
+            return_exceptions=True
+        )
+        soups = dict(zip(urls, pages))
+        
+        results = []
+        for committee_type, url in committees:
+            logger.info("Scraping %s from: %s", committee_type, url)
+            soup = soups[url]
+            if isinstance(soup, Exception):
+                results.append(soup)
+                continue
+            try:
+                results.append(parse_committee_members(soup, committee_type))
+            except Exception as e:
+                results.append(e)
+    
+    # authors.normalized_name is not unique, so only one conference may be
+    # inserting at a time; within it, committees go in order so an author
+    # shared between committees is created once and then found
+    async with insert_lock:
+        for (committee_type, _), members in zip(committees, results):
+            if isinstance(members, Exception):
+                logger.warning("Failed to scrape %s: %s", committee_type, members)
+                continue
+            
+            logger.info("Found %d %s members", len(members), committee_type)
+            
+            if args.dry_run:
+                if logger.isEnabledFor(logging.INFO):
+                    for member in members:
+                        logger.info("  - %s (%s) [%s]", member.name, member.affiliation or '?', member.position)
+                continue
+            
+            try:
+                await insert_committee_members(inserts, conf.id, members)
+            except Exception as e:
+                logger.warning("Failed to scrape %s: %s", committee_type, e)
 
 
 async def main():
@@ -679,6 +896,9 @@ async def main():
     parser.add_argument('--force', action='store_true', help='Force re-scrape even if data exists')
     parser.add_argument('--local', action='store_true', help='Use local files from ~/Web/')
     parser.add_argument('--local-dir', type=str, help='Custom local web directory')
+    parser.add_argument('--no-cache', action='store_true', help='Skip the on-disk page cache')
+    parser.add_argument('--refresh-cache', action='store_true',
+                        help='Revalidate cached pages with the server (ETag/Last-Modified)')
     
     args = parser.parse_args()
     
@@ -690,7 +910,7 @@ async def main():
         local_dir = get_local_dir(args)
         if not local_dir.exists():
             raise FileNotFoundError(f"Local directory does not exist: {local_dir}")
-        logger.info(f"Using local files from: {local_dir}")
+        logger.info("Using local files from: %s", local_dir)
     
     # Connect to database
     database_url = os.environ.get('DATABASE_URL')
@@ -702,6 +922,8 @@ async def main():
     try:
         logger.info("Connected to database")
         
+        await check_author_lookup_plan(pool)
+        
         # Get conferences
         conferences = await get_conferences_to_scrape(pool, args)
         
@@ -709,60 +931,25 @@ async def main():
             logger.info("No conferences found matching criteria")
             return
         
-        logger.info(f"Found {len(conferences)} conference(s) to scrape")
+        logger.info("Found %d conference(s) to scrape", len(conferences))
         
-        # Process each conference
-        for conf in conferences:
-            logger.info(f"\n=== Processing {conf.venue} {conf.year} ===")
-            
-            # Check if should skip
-            if not args.force:
-                exists = await check_committee_exists(pool, conf.id)
-                if exists:
-                    logger.info(f"Committee data already exists for {conf.venue} {conf.year}. Use --force to re-scrape.")
-                    continue
-            
-            # Scrape Program Committee
-            if conf.archive_pc_url:
-                try:
-                    members = await scrape_committee_page(conf.archive_pc_url, args, 'PC')
-                    logger.info(f"Found {len(members)} PC members")
-                    
-                    if args.dry_run:
-                        for member in members:
-                            logger.info(f"  - {member.name} ({member.affiliation or '?'}) [{member.position}]")
-                    else:
-                        await insert_committee_members(pool, conf.id, members)
-                except Exception as e:
-                    logger.warning(f"Failed to scrape PC: {e}")
-            
-            # Scrape Organizing Committee
-            if conf.archive_organizers_url:
-                try:
-                    members = await scrape_committee_page(conf.archive_organizers_url, args, 'OC')
-                    logger.info(f"Found {len(members)} OC members")
-                    
-                    if args.dry_run:
-                        for member in members:
-                            logger.info(f"  - {member.name} ({member.affiliation or '?'}) [{member.position}]")
-                    else:
-                        await insert_committee_members(pool, conf.id, members)
-                except Exception as e:
-                    logger.warning(f"Failed to scrape OC: {e}")
+        # One session for the whole run so page fetches reuse keep-alive
+        # connections; aiohttp already negotiates gzip/deflate by default
+        connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+        async with pool.acquire() as conn, aiohttp.ClientSession(connector=connector) as session:
+            inserts = await InsertSession.prepare(conn)
             
-            # Scrape Steering Committee
-            if conf.archive_steering_url:
-                try:
-                    members = await scrape_committee_page(conf.archive_steering_url, args, 'SC')
-                    logger.info(f"Found {len(members)} SC members")
-                    
-                    if args.dry_run:
-                        for member in members:
-                            logger.info(f"  - {member.name} ({member.affiliation or '?'}) [{member.position}]")
-                    else:
-                        await insert_committee_members(pool, conf.id, members)
-                except Exception as e:
-                    logger.warning(f"Failed to scrape SC: {e}")
+            # Conferences are scraped concurrently; inserts are serialized
+            semaphore = asyncio.Semaphore(8)
+            insert_lock = asyncio.Lock()
+            results = await asyncio.gather(
+                *(process_conference(conf, pool, inserts, session, args, semaphore, insert_lock)
+                  for conf in conferences),
+                return_exceptions=True
+            )
+            for conf, result in zip(conferences, results):
+                if isinstance(result, Exception):
+                    logger.warning("Failed to process %s %d: %s", conf.venue, conf.year, result)
         
         logger.info("\nScraping complete!")
     
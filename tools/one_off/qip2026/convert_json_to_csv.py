@@ -3,22 +3,29 @@
 
 import json
 import csv
+import re
 import sys
 from pathlib import Path
 
+# ijson streams the papers array instead of loading the whole dump; it is
+# optional since the stdlib parser reads the same files.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+ARXIV_NEW_RE = re.compile(r'(?<!\d)(\d{4}\.\d{4,5})(?!\d)')
+ARXIV_OLD_RE = re.compile(r'(?<![\w/])([a-z\-]+/\d{7})(?!\d)')
+
 
 def parse_arxiv_id(arxiv_string):
     """Extract arXiv ID from string like 'arXiv: 2503.19125' or 'arXiv:2310.05213v3'."""
     if not arxiv_string:
         return None
     
-    # Remove 'arXiv:' prefix and whitespace
-    arxiv_id = arxiv_string.replace('arXiv:', '').replace('arXiv', '').strip()
-    # Remove 'v' version suffix if present
-    if 'v' in arxiv_id:
-        arxiv_id = arxiv_id.split('v')[0]
-    
-    return arxiv_id if arxiv_id else None
+    # The version suffix ('v3') falls outside the match
+    match = ARXIV_NEW_RE.search(arxiv_string) or ARXIV_OLD_RE.search(arxiv_string)
+    return match.group(1) if match else None
 
 
 def determine_paper_type(decision):
@@ -38,15 +45,43 @@ def determine_paper_type(decision):
 def convert_json_to_csv(json_file, output_csv, venue='QIP', year=2026):
     """Convert QIP JSON format to CSV format matching talk import schema."""
     
-    # Load JSON data
-    with open(json_file, 'r') as f:
-        papers = json.load(f)
+    fieldnames = [
+        'venue', 'year', 'paper_type', 'title', 'authors', 
+        'affiliations', 'abstract', 'arxiv_ids', 'presentation_url', 
+        'video_url', 'youtube_id', 'session_name', 'award', 'notes',
+        'speaker', 'scheduled_date', 'scheduled_time', 'duration_minutes'
+    ]
     
-    print(f"Loaded {len(papers)} papers from {json_file}")
+    # Rows are written as they are built, so only one paper is held at a
+    # time; a 1 MiB output buffer batches them into a few large writes
+    with open(json_file, 'rb') as f, \
+            open(output_csv, 'w', newline='', encoding='utf-8', buffering=1 << 20) as out:
+        writer = csv.DictWriter(out, fieldnames=fieldnames)
+        writer.writeheader()
+        total, type_counts = 0, {}
+        for row in _accepted_rows(_load_papers(f), venue, year):
+            writer.writerow(row)
+            total += 1
+            type_counts[row['paper_type']] = type_counts.get(row['paper_type'], 0) + 1
     
-    # Prepare CSV data
-    csv_data = []
+    print(f"✓ Converted {total} accepted papers to {output_csv}")
+    print(f"\nBreakdown by paper type:")
+    for pt, count in sorted(type_counts.items()):
+        print(f"  {pt}: {count}")
     
+    return total
+
+
+def _load_papers(f):
+    """Yield the papers of a QIP JSON dump opened in binary mode."""
+    if ijson is not None:
+        yield from ijson.items(f, 'item')
+    else:
+        yield from json.load(f)
+
+
+def _accepted_rows(papers, venue, year):
+    """Yield a CSV row for each accepted paper."""
     for paper in papers:
         # Skip if not accepted
         if 'Accepted' not in paper.get('decision', ''):
@@ -97,31 +132,7 @@ def convert_json_to_csv(json_file, output_csv, venue='QIP', year=2026):
             'duration_minutes': ''  # To be filled by schedule parser
         }
         
-        csv_data.append(row)
-    
-    # Write CSV
-    fieldnames = [
-        'venue', 'year', 'paper_type', 'title', 'authors', 
-        'affiliations', 'abstract', 'arxiv_ids', 'presentation_url', 
-        'video_url', 'youtube_id', 'session_name', 'award', 'notes',
-        'speaker', 'scheduled_date', 'scheduled_time', 'duration_minutes'
-    ]
-    
-    with open(output_csv, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(csv_data)
-    
-    print(f"✓ Converted {len(csv_data)} accepted papers to {output_csv}")
-    print(f"\nBreakdown by paper type:")
-    type_counts = {}
-    for row in csv_data:
-        pt = row['paper_type']
-        type_counts[pt] = type_counts.get(pt, 0) + 1
-    for pt, count in sorted(type_counts.items()):
-        print(f"  {pt}: {count}")
-    
-    return csv_data
+        yield row
 
 
 if __name__ == '__main__':
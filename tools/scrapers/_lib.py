@@ -3,6 +3,7 @@ import logging
 import os
 import re
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 from urllib.parse import unquote
@@ -30,39 +31,57 @@ _SPECIAL_CHAR_MAP = str.maketrans({
     'Ş': 'S', 'ş': 's',
 })
 
+# Honorific / suffix tokens, lowercased with trailing '.' and ',' removed.
+_HONORIFICS = frozenset({'dr', 'prof', 'jr', 'sr', 'phd', 'ph.d', 'md', 'm.d'})
+_INITIAL_RE = re.compile(r"[a-z]\.?")
 
+
+@lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     """Normalize an author name for deduplication-grade matching.
 
     Transformations (applied in order):
-      1. Strip honorifics / suffixes: Dr., Prof., Jr., Sr., Ph.D., M.D.
+      1. Strip honorific / suffix tokens: Dr., Prof., Jr., Sr., Ph.D., M.D.
+         Only whole tokens go, so "Drew" and "Srinivasan" keep their prefix.
       2. Replace special letters that don't decompose via NFD (ł, ø, æ, ß, …).
       3. Unicode NFKD decomposition + strip combining marks (é → e, ü → u).
       4. Lowercase.
       5. Drop single-letter middle-initial tokens, both with and without a
          trailing period (so "Umesh V. Vazirani" and "Umesh Vazirani" collapse).
       6. Collapse whitespace.
+
+    Results are cached: importers and split_name() normalize the same names
+    several times over.
     """
     if not name:
         return ''
-    s = re.sub(r'\b(Dr|Prof|Jr|Sr|Ph\.?D|M\.?D)\.?\s*', ' ', name, flags=re.IGNORECASE)
+    s = ' '.join(t for t in name.split() if t.lower().rstrip('.,') not in _HONORIFICS)
     s = s.translate(_SPECIAL_CHAR_MAP)
     s = unicodedata.normalize('NFKD', s)
     s = ''.join(c for c in s if not unicodedata.combining(c))
     s = s.lower()
-    tokens = [t for t in s.split() if not re.fullmatch(r"[a-z]\.?", t)]
+    tokens = [t for t in s.split() if not _INITIAL_RE.fullmatch(t)]
     return ' '.join(tokens)
 
 
+@lru_cache(maxsize=4096)
 def split_name(full_name: str) -> tuple[str, str]:
     """Split a (normalized) full name into (family_name, given_name)."""
-    normalized = normalize_name(full_name)
+    return split_normalized_name(normalize_name(full_name))
+
+
+def split_normalized_name(normalized: str) -> tuple[str, str]:
+    """``split_name`` for a name that has already been through ``normalize_name``."""
     parts = normalized.rsplit(' ', 1)
     if len(parts) == 1:
         return parts[0], ''
     return parts[1], parts[0]
 
 
+_DEFAULT_LOCAL_DIR = Path.home() / 'Web'
+
+
+@lru_cache(maxsize=1024)
 def url_to_local_path(url: str, local_dir: Optional[Path] = None) -> Path:
     """Map an http(s) URL to its mirror under ``local_dir``.
 
@@ -70,9 +89,10 @@ def url_to_local_path(url: str, local_dir: Optional[Path] = None) -> Path:
     extension get an ``index.html`` appended.
     """
     if local_dir is None:
-        local_dir = Path.home() / 'Web'
+        local_dir = _DEFAULT_LOCAL_DIR
 
-    url = unquote(url)
+    if '%' in url:
+        url = unquote(url)
     without_protocol = url.removeprefix('http://').removeprefix('https://')
     parts = without_protocol.split('/', 1)
     domain = parts[0]
@@ -87,6 +107,33 @@ def url_to_local_path(url: str, local_dir: Optional[Path] = None) -> Path:
     return full_path
 
 
+# Shared by every get_archive_url() call in a run; opened on first use and
+# closed by the CLI runners via close_pool().
+_pool: Optional[asyncpg.Pool] = None
+
+
+async def _get_pool(database_url: str) -> asyncpg.Pool:
+    """Return the module's connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        pool = await asyncpg.create_pool(dsn=database_url, min_size=1, max_size=4,
+                                         command_timeout=10)
+        # Another caller may have created one while we were connecting
+        if _pool is None:
+            _pool = pool
+        else:
+            await pool.close()
+    return _pool
+
+
+async def close_pool() -> None:
+    """Close the pool opened by get_archive_url(), if any."""
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        await pool.close()
+
+
 async def get_archive_url(venue: str, year: int, columns: List[str]) -> Optional[str]:
     """Look up the archive URL for ``venue``/``year`` from the conferences table.
 
@@ -104,24 +151,21 @@ async def get_archive_url(venue: str, year: int, columns: List[str]) -> Optional
 
     select = ', '.join(columns)
     try:
-        conn = await asyncpg.connect(database_url)
-        try:
-            row = await conn.fetchrow(
-                f"SELECT {select} FROM conferences WHERE venue = $1 AND year = $2",
-                venue.upper(),
-                year,
-            )
-            if not row:
-                logger.warning(f"Conference {venue} {year} not found in database")
-                return None
-            for col in columns:
-                if row[col]:
-                    logger.info(f"Found archive URL in database: {row[col]}")
-                    return row[col]
-            logger.warning(f"Conference found but no archive URLs set for {venue} {year}")
+        pool = await _get_pool(database_url)
+        row = await pool.fetchrow(
+            f"SELECT {select} FROM conferences WHERE venue = $1 AND year = $2",
+            venue.upper(),
+            year,
+        )
+        if not row:
+            logger.warning(f"Conference {venue} {year} not found in database")
             return None
-        finally:
-            await conn.close()
+        for col in columns:
+            if row[col]:
+                logger.info(f"Found archive URL in database: {row[col]}")
+                return row[col]
+        logger.warning(f"Conference found but no archive URLs set for {venue} {year}")
+        return None
     except Exception as e:
         logger.warning(f"Error querying database: {e}. Will use scraper's default URL.")
         return None
@@ -1,9 +1,66 @@
 """Shared scraper plumbing for committees + talks."""
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import unicodedata
 from abc import ABC, abstractmethod
-from typing import Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional
+from uuid import uuid4
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, CData, NavigableString, SoupStrainer, Tag, UnicodeDammit
+
+# lxml is in requirements.txt, but it's a C extension that doesn't always
+# build; the pure-Python parser is slower but produces the same API.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Drops <head> (inline CSS/JS, meta) for scrapers that read whole pages.
+# html.parser doesn't synthesize a <body> for pages that omit the tag, so
+# there the strainer would match nothing; parse everything instead.
+BODY_ONLY: Optional[SoupStrainer] = SoupStrainer('body') if HTML_PARSER == 'lxml' else None
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).parent / 'cache'
+
+# String types that get_text() includes; skips comments, <script> text, etc.
+_TEXT_TYPES = (NavigableString, CData)
+
+
+_MAX_AGE_RE = re.compile(r'max-age\s*=\s*(\d+)')
+
+
+def _cache_meta(response: requests.Response) -> Optional[dict]:
+    """Cache metadata for ``response``; ``None`` if it must not be stored.
+
+    Keeps the ETag/Last-Modified validators, plus an ``expires`` timestamp
+    when ``Cache-Control`` grants a max-age.
+    """
+    cache_control = response.headers.get('Cache-Control', '').lower()
+    if 'no-store' in cache_control:
+        return None
+    meta = {k: response.headers[k] for k in ('ETag', 'Last-Modified') if k in response.headers}
+    match = _MAX_AGE_RE.search(cache_control)
+    if match and 'no-cache' not in cache_control:
+        meta['expires'] = time.time() + int(match.group(1))
+    return meta
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to a temporary name and rename it over ``path``, so a
+    concurrent fetch of the same URL never reads a partly written file."""
+    tmp_path = path.with_name(f"{path.name}.{uuid4().hex}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
 
 
 class Scraper(ABC):
@@ -11,8 +68,20 @@ class Scraper(ABC):
 
     Subclasses provide ``get_url`` (the page to fetch) and one of the
     kind-specific ``parse_*`` methods. ``fetch_page`` is shared.
+
+    Subclasses that only read one part of the page can set ``parse_only`` to
+    a ``SoupStrainer`` so the rest of the document is never built into the
+    tree.
+
+    Remote pages are cached under ``cache_dir`` together with their
+    ETag/Last-Modified and ``Cache-Control`` lifetime: fresh copies are reused
+    as-is, stale ones are revalidated with a conditional GET. Set
+    ``cache_dir`` to ``None`` to always download.
     """
 
+    parse_only: Optional[SoupStrainer] = None
+    cache_dir: Optional[Path] = CACHE_DIR
+
     def __init__(self, year: int, local_file: Optional[str] = None):
         self.year = year
         self.local_file = local_file
@@ -25,31 +94,109 @@ class Scraper(ABC):
     def fetch_page(self) -> BeautifulSoup:
         """Fetch and parse the HTML page.
 
-        Local files are read as bytes so BeautifulSoup can sniff the encoding
+        Local files are read as bytes so UnicodeDammit can sniff the encoding
         from the document — some QCrypt mirror pages declare UTF-8 in <meta>
-        but actually contain CP1252-encoded bytes.
+        but actually contain CP1252-encoded bytes. The markup is decoded
+        before it reaches lxml: given bytes, lxml trusts the declared
+        encoding and turns the CP1252 bytes into U+FFFD instead of falling
+        back. UTF-8 is tried before charset detection, which is slow on big
+        pages and only needed when neither the declared encoding nor UTF-8
+        decodes.
         """
         if self.local_file:
             with open(self.local_file, 'rb') as f:
                 html_content = f.read()
         else:
-            url = self.get_url()
+            html_content = self._download(self.get_url())
+
+        markup = UnicodeDammit(html_content, is_html=True, user_encodings=['utf-8']).unicode_markup
+        self.soup = BeautifulSoup(markup, HTML_PARSER, parse_only=self.parse_only)
+        return self.soup
+
+    def _download(self, url: str) -> bytes:
+        """GET ``url`` through the page cache.
+
+        A cached copy still inside its ``Cache-Control: max-age`` is used
+        without a request; otherwise it is revalidated and reused on a 304.
+        """
+        if self.cache_dir is None:
             response = requests.get(url, timeout=30)
             response.raise_for_status()
-            html_content = response.content
+            return response.content
 
-        self.soup = BeautifulSoup(html_content, 'html.parser')
-        return self.soup
+        cache_path = self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.html"
+        meta_path = cache_path.with_suffix('.json')
+
+        headers = {}
+        if cache_path.exists() and meta_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text())
+            except (OSError, ValueError):
+                # Left truncated by an older writer: refetch from scratch
+                meta = {}
+            if meta.get('expires', 0) > time.time():
+                logger.info(f"Using cached copy: {url}")
+                return cache_path.read_bytes()
+            if 'ETag' in meta:
+                headers['If-None-Match'] = meta['ETag']
+            if 'Last-Modified' in meta:
+                headers['If-Modified-Since'] = meta['Last-Modified']
+
+        response = requests.get(url, headers=headers, timeout=30)
+        if headers and response.status_code == 304:
+            logger.info(f"Cached copy still current: {url}")
+            # A 304 may carry a new freshness lifetime
+            refreshed = _cache_meta(response)
+            if refreshed:
+                meta.update(refreshed)
+                _write_atomic(meta_path, json.dumps(meta).encode())
+            return cache_path.read_bytes()
+        response.raise_for_status()
+
+        meta = _cache_meta(response)
+        if meta:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _write_atomic(cache_path, response.content)
+            _write_atomic(meta_path, json.dumps(meta).encode())
+        return response.content
 
     @staticmethod
+    def split_at_br(tag: Tag) -> List[str]:
+        """Return the text of ``tag`` split at each ``<br>``, pieces stripped.
+
+        Walks the existing tree, including ``<br>``s nested in inline tags,
+        so the fragments never have to be re-serialized and re-parsed.
+        """
+        pieces = []
+        current: List[str] = []
+        for node in tag.descendants:
+            if isinstance(node, Tag):
+                if node.name == 'br':
+                    pieces.append(''.join(current).strip())
+                    current = []
+            elif type(node) in _TEXT_TYPES:
+                current.append(node)
+        pieces.append(''.join(current).strip())
+        return pieces
+
+    # Cached: the same names and affiliations recur across a page's
+    # committees and across the years of a batch run.
+    @staticmethod
+    @lru_cache(maxsize=4096)
     def normalize_name(name: str) -> str:
-        """Collapse whitespace in a person's name."""
-        return ' '.join(name.strip().split())
+        """Collapse whitespace in a person's name and compose it to NFC.
+
+        Some pages spell accented letters as base letter + combining mark;
+        composing them here keeps ``full_name`` byte-equal to the same name
+        scraped from a precomposed page.
+        """
+        return unicodedata.normalize('NFC', ' '.join(name.split()))
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def normalize_affiliation(affiliation: str) -> Optional[str]:
-        """Collapse whitespace in an affiliation; empty string → None."""
+        """Collapse whitespace in an affiliation (NFC); empty string → None."""
         if not affiliation:
             return None
-        normalized = ' '.join(affiliation.strip().split())
+        normalized = unicodedata.normalize('NFC', ' '.join(affiliation.split()))
         return normalized if normalized else None
@@ -1,9 +1,38 @@
 """Base scraper class for conference committee data."""
+import re
 from abc import abstractmethod
 from typing import Dict, List, Optional
 
 from ..base import Scraper
 
+# (substring, role_title), in priority order for detect_role_title().
+_ROLE_PATTERNS = (
+    ('general chair', 'General Chair'),
+    ('conference chair', 'General Chair'),
+    ('program chair', 'Program Chair'),
+    ('programme chair', 'Program Chair'),
+    ('steering chair', 'Steering Chair'),
+    ('local chair', 'Local Chair'),
+    ('publicity chair', 'Publicity Chair'),
+    ('web chair', 'Web Chair'),
+    ('webmaster', 'Web Chair'),
+    ('technical operations chair', 'Technical Operations Chair'),
+    ('local arrangements', 'Local Arrangements Chair'),
+    ('registration chair', 'Registration Chair'),
+    ('proceedings chair', 'Proceedings Chair'),
+    ('poster chair', 'Poster Chair'),
+    ('tutorial chair', 'Tutorial Chair'),
+    ('workshop chair', 'Workshop Chair'),
+    ('sponsorship chair', 'Sponsorship Chair'),
+    ('finance chair', 'Finance Chair'),
+    ('social events chair', 'Social Events Chair'),
+)
+# One group per pattern inside a lookahead, so finditer reports overlapping
+# occurrences and m.lastindex identifies which pattern matched.
+_ROLE_RE = re.compile('(?=' + '|'.join(
+    f'({re.escape(pattern)})' for pattern, _ in _ROLE_PATTERNS
+) + ')')
+
 
 class BaseCommitteeScraper(Scraper):
     """Abstract base class for conference committee scrapers."""
@@ -24,21 +53,20 @@ class BaseCommitteeScraper(Scraper):
 
     @staticmethod
     def _deduplicate_members(members: List[Dict[str, str]]) -> List[Dict[str, str]]:
-        """Remove duplicate members based on name, committee type, and position."""
-        seen = set()
-        unique_members = []
+        """Remove duplicate members based on name, committee type, and position.
 
+        Parsers pass names through ``normalize_name``, so they are already
+        stripped; only case is folded here. The first occurrence is kept.
+        """
+        unique: Dict[tuple, Dict[str, str]] = {}
         for member in members:
             key = (
-                member.get('full_name', '').lower().strip(),
+                (member.get('full_name') or '').casefold(),
                 member.get('committee_type', ''),
                 member.get('position', ''),
             )
-            if key not in seen:
-                seen.add(key)
-                unique_members.append(member)
-
-        return unique_members
+            unique.setdefault(key, member)
+        return list(unique.values())
 
     @staticmethod
     def detect_role_title(text: str, heading_text: str = '') -> Optional[str]:
@@ -48,31 +76,9 @@ class BaseCommitteeScraper(Scraper):
         Examples: 'General Chair', 'Program Chair', 'Publicity Chair', etc.
         """
         combined = f"{heading_text} {text}".lower()
-
-        role_patterns = [
-            ('general chair', 'General Chair'),
-            ('conference chair', 'General Chair'),
-            ('program chair', 'Program Chair'),
-            ('programme chair', 'Program Chair'),
-            ('steering chair', 'Steering Chair'),
-            ('local chair', 'Local Chair'),
-            ('publicity chair', 'Publicity Chair'),
-            ('web chair', 'Web Chair'),
-            ('webmaster', 'Web Chair'),
-            ('technical operations chair', 'Technical Operations Chair'),
-            ('local arrangements', 'Local Arrangements Chair'),
-            ('registration chair', 'Registration Chair'),
-            ('proceedings chair', 'Proceedings Chair'),
-            ('poster chair', 'Poster Chair'),
-            ('tutorial chair', 'Tutorial Chair'),
-            ('workshop chair', 'Workshop Chair'),
-            ('sponsorship chair', 'Sponsorship Chair'),
-            ('finance chair', 'Finance Chair'),
-            ('social events chair', 'Social Events Chair'),
-        ]
-
-        for pattern, title in role_patterns:
-            if pattern in combined:
-                return title
-
-        return None
+        # Every position where some pattern starts; the earliest entry in
+        # _ROLE_PATTERNS wins, not the leftmost match in the text.
+        matched = {m.lastindex for m in _ROLE_RE.finditer(combined)}
+        if not matched:
+            return None
+        return _ROLE_PATTERNS[min(matched) - 1][1]
@@ -1,17 +1,21 @@
 """CLI body for `import_from_csv.py committees` — import committee CSVs into the DB."""
 
+import asyncio
 import csv
+import itertools
 import logging
 import os
-import re
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict
-from uuid import UUID
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
 import asyncpg
+from asyncpg.prepared_stmt import PreparedStatement
 from dotenv import load_dotenv
 
-from scrapers._lib import normalize_name, split_name
+from scrapers._lib import normalize_name, split_normalized_name
 
 
 logging.basicConfig(
@@ -20,218 +24,348 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Rows handed to the batched queries at a time.
+_CHUNK_SIZE = 1000
+
+# Times a file's transaction is tried when postgres aborts it as a deadlock
+# victim (see import_from_csv).
+_DEADLOCK_ATTEMPTS = 3
+
+
+# CSV committee_type / position values -> database enum values.
+_COMMITTEE_TYPES = {
+    'program': 'PC',
+    'steering': 'SC',
+    'local_organizing': 'Local',
+    'organizing': 'OC'
+}
+
+_POSITIONS = {
+    'chair': 'chair',
+    'co-chair': 'co_chair',
+    'area_chair': 'area_chair',
+    'member': 'member'
+}
+
 
 def map_committee_type(committee_type: str) -> str:
     """Map CSV committee_type to database enum value."""
-    mapping = {
-        'program': 'PC',
-        'steering': 'SC',
-        'local_organizing': 'Local',
-        'organizing': 'OC'
-    }
-    return mapping.get(committee_type, committee_type)
+    return _COMMITTEE_TYPES.get(committee_type, committee_type)
 
 
 def map_position(position: str) -> str:
     """Map CSV position to database enum value."""
     if not position:
         return 'member'
-    
-    position = position.lower().strip()
-    mapping = {
-        'chair': 'chair',
-        'co-chair': 'co_chair',
-        'area_chair': 'area_chair',
-        'member': 'member'
-    }
-    return mapping.get(position, 'member')
-
-
-async def get_or_create_author(
-    conn: asyncpg.Connection,
-    full_name: str,
-    affiliation: Optional[str]
-) -> UUID:
-    """Get existing author or create new one."""
-    family_name, given_name = split_name(full_name)
-    normalized_full = normalize_name(full_name).lower()
-    
-    # Try to find existing author by normalized_name
-    author_id = await conn.fetchval(
-        """
-        SELECT a.id FROM authors a
-        LEFT JOIN author_name_variants v ON a.id = v.author_id
-        WHERE a.normalized_name = $1
-           OR LOWER(v.variant_name) = $1
-        LIMIT 1
-        """,
-        normalized_full
-    )
-    
-    if author_id:
-        logger.debug(f"Found existing author: {full_name} -> {author_id}")
-        
-        # Update affiliation if provided and different
-        if affiliation:
-            await conn.execute(
-                """
-                UPDATE authors 
-                SET affiliation = $1 
-                WHERE id = $2 AND (affiliation IS NULL OR affiliation != $1)
-                """,
-                affiliation,
-                author_id
-            )
-        
-        return author_id
-    
-    # Create new author
-    author_id = await conn.fetchval(
-        """
-        INSERT INTO authors (full_name, family_name, given_name, normalized_name, affiliation, creator, modifier)
-        VALUES ($1, $2, $3, $4, $5, 'import_from_csv', 'import_from_csv')
-        RETURNING id
-        """,
-        full_name,
-        family_name,
-        given_name,
-        normalized_full,
-        affiliation
+    return _POSITIONS.get(position.lower().strip(), 'member')
+
+
+_FIND_AUTHORS_SQL = """
+    SELECT a.normalized_name AS name, a.id FROM authors a
+    WHERE a.normalized_name = ANY($1::text[])
+    UNION ALL
+    SELECT LOWER(v.variant_name), v.author_id FROM author_name_variants v
+    WHERE LOWER(v.variant_name) = ANY($1::text[])
+"""
+
+# New authors are loaded with COPY. IDs are generated here rather than by
+# the column default so COPY doesn't need a RETURNING it can't give.
+_AUTHOR_COPY_COLUMNS = [
+    'id', 'full_name', 'family_name', 'given_name', 'normalized_name', 'affiliation', 'creator', 'modifier'
+]
+
+_UPDATE_AFFILIATIONS_SQL = """
+    UPDATE authors a
+    SET affiliation = u.affiliation
+    FROM unnest($1::uuid[], $2::text[]) AS u(id, affiliation)
+    WHERE a.id = u.id AND (a.affiliation IS NULL OR a.affiliation != u.affiliation)
+"""
+
+_GET_CONFERENCE_SQL = "SELECT id FROM conferences WHERE venue = $1 AND year = $2"
+
+# Transaction-scoped advisory locks for concurrent imports (--jobs). Files
+# for the same conference take turns, and so do files that create authors:
+# the second one waits for the first to commit and then finds its authors
+# instead of inserting duplicates.
+_LOCK_CONFERENCE_SQL = "SELECT pg_advisory_xact_lock(hashtext('committee_roles'), hashtext($1::uuid::text))"
+_LOCK_AUTHORS_SQL = "SELECT pg_advisory_xact_lock(hashtext('authors'), 0)"
+
+# Update-or-insert every role in one statement. committee_roles is only
+# unique on (conference, author, committee, position), so ON CONFLICT
+# can't express "one role per committee"; the UPDATE branch targets the
+# existing row for (conference, author, committee) and the INSERT branch
+# covers the rest.
+_UPSERT_ROLES_SQL = """
+    WITH input AS (
+        SELECT author_id, committee::committee_type AS committee,
+               position::committee_position AS position, affiliation, role_title
+        FROM unnest($2::uuid[], $3::text[], $4::text[], $5::text[], $6::text[])
+            AS t(author_id, committee, position, affiliation, role_title)
+    ), updated AS (
+        UPDATE committee_roles cr
+        SET position = i.position, affiliation = i.affiliation, role_title = i.role_title,
+            updated_at = NOW(), modifier = 'import_from_csv'
+        FROM input i
+        WHERE cr.id = (
+            SELECT id FROM committee_roles
+            WHERE conference_id = $1 AND author_id = i.author_id AND committee = i.committee
+            LIMIT 1
+        )
+        RETURNING cr.author_id, cr.committee
+    ), inserted AS (
+        INSERT INTO committee_roles (conference_id, author_id, committee, position, affiliation, role_title, creator, modifier)
+        SELECT $1, i.author_id, i.committee, i.position, i.affiliation, i.role_title,
+               'import_from_csv', 'import_from_csv'
+        FROM input i
+        WHERE NOT EXISTS (
+            SELECT 1 FROM updated u WHERE u.author_id = i.author_id AND u.committee = i.committee
+        )
+        RETURNING author_id, committee
     )
-    
-    logger.info(f"Created new author: {full_name} ({author_id})")
-    return author_id
+    SELECT author_id, committee::text, FALSE AS inserted FROM updated
+    UNION ALL
+    SELECT author_id, committee::text, TRUE FROM inserted
+"""
+
+
+@dataclass
+class ImportSession:
+    """A connection plus the import statements, prepared once on it.
+
+    Every CSV file in a run goes through the same session, so the server
+    parses and plans each statement once rather than once per file. The
+    session also remembers conference and author IDs it has already
+    resolved; committee members (steering committees especially) repeat
+    from one year's file to the next. Sessions on parallel connections
+    share these memos.
+    """
+    conn: asyncpg.Connection
+    find_authors: PreparedStatement
+    update_affiliations: PreparedStatement
+    get_conference: PreparedStatement
+    upsert_roles: PreparedStatement
+    lock_conference: PreparedStatement
+    lock_authors: PreparedStatement
+    conference_ids: Dict[Tuple[str, int], Optional[UUID]] = field(default_factory=dict)
+    # Only IDs from committed transactions go in here; an author created by a
+    # file that was rolled back doesn't exist.
+    author_ids: Dict[str, UUID] = field(default_factory=dict)
+
+    @classmethod
+    async def prepare(
+        cls,
+        conn: asyncpg.Connection,
+        conference_ids: Optional[Dict[Tuple[str, int], Optional[UUID]]] = None,
+        author_ids: Optional[Dict[str, UUID]] = None
+    ) -> 'ImportSession':
+        """Prepare the statements on ``conn``; pass memos to share them between sessions."""
+        session = cls(
+            conn=conn,
+            find_authors=await conn.prepare(_FIND_AUTHORS_SQL),
+            update_affiliations=await conn.prepare(_UPDATE_AFFILIATIONS_SQL),
+            get_conference=await conn.prepare(_GET_CONFERENCE_SQL),
+            upsert_roles=await conn.prepare(_UPSERT_ROLES_SQL),
+            lock_conference=await conn.prepare(_LOCK_CONFERENCE_SQL),
+            lock_authors=await conn.prepare(_LOCK_AUTHORS_SQL),
+        )
+        if conference_ids is not None:
+            session.conference_ids = conference_ids
+        if author_ids is not None:
+            session.author_ids = author_ids
+        return session
+
+
+async def resolve_authors(
+    session: ImportSession,
+    members: List[Dict[str, str]],
+    member_names: List[str]
+) -> Dict[str, UUID]:
+    """Map each member's normalized name to an author ID, creating missing authors.
+
+    ``member_names`` holds ``normalize_name(full_name)`` for each member.
+
+    Existing authors (and name variants) are looked up in one query; authors
+    that don't exist yet are bulk-loaded with a single COPY. Affiliations of existing
+    authors are refreshed from the CSV.
+    """
+    first_seen: Dict[str, Dict[str, str]] = {}
+    for name, member in zip(member_names, members):
+        first_seen.setdefault(name, member)
+    names = list(first_seen)
+
+    author_ids = {name: session.author_ids[name] for name in names if name in session.author_ids}
+    unknown = [name for name in names if name not in author_ids]
+    if unknown:
+        rows = await session.find_authors.fetch(unknown)
+        for row in rows:
+            author_ids.setdefault(row['name'], row['id'])
+
+    missing = [name for name in names if name not in author_ids]
+    if missing:
+        # Another import may have created some of them while we waited.
+        await session.lock_authors.fetchval()
+        for row in await session.find_authors.fetch(missing):
+            author_ids.setdefault(row['name'], row['id'])
+        missing = [name for name in names if name not in author_ids]
+
+    if missing:
+        new_rows = []
+        for name in missing:
+            member = first_seen[name]
+            family_name, given_name = split_normalized_name(name)
+            new_rows.append((uuid4(), member['full_name'], family_name, given_name, name,
+                             member.get('affiliation'), 'import_from_csv', 'import_from_csv'))
+        await session.conn.copy_records_to_table(
+            'authors', records=new_rows, columns=_AUTHOR_COPY_COLUMNS
+        )
+        for author_id, full_name, _, _, name, *_ in new_rows:
+            author_ids[name] = author_id
+            logger.info(f"Created new author: {full_name} ({author_id})")
+
+    # Update affiliation if provided and different, the last row for an author
+    # winning. Members that created their author row above already wrote their
+    # affiliation.
+    created_by = {id(first_seen[name]) for name in missing}
+    affiliations: Dict[UUID, str] = {}
+    for name, member in zip(member_names, members):
+        if member.get('affiliation') and id(member) not in created_by:
+            affiliations[author_ids[name]] = member['affiliation']
+    if affiliations:
+        await session.update_affiliations.fetch(list(affiliations), list(affiliations.values()))
+
+    return author_ids
 
 
 async def get_conference_id(
-    conn: asyncpg.Connection,
+    session: ImportSession,
     venue: str,
     year: int
 ) -> Optional[UUID]:
     """Get conference ID."""
-    return await conn.fetchval(
-        "SELECT id FROM conferences WHERE venue = $1 AND year = $2",
-        venue,
-        year
-    )
+    key = (venue, year)
+    if key not in session.conference_ids:
+        session.conference_ids[key] = await session.get_conference.fetchval(venue, year)
+    return session.conference_ids[key]
 
 
-async def import_member(
-    conn: asyncpg.Connection,
-    venue: str,
-    year: int,
-    member: Dict[str, str]
-) -> bool:
-    """Import a single committee member."""
-    
-    # Get conference
-    conference_id = await get_conference_id(conn, venue, year)
-    if not conference_id:
-        logger.error(f"Conference not found: {venue} {year}")
-        return False
-    
-    # Get or create author
-    author_id = await get_or_create_author(
-        conn,
-        member['full_name'],
-        member.get('affiliation')
-    )
-    
-    # Map values to database enums
-    db_committee = map_committee_type(member['committee_type'])
-    db_position = map_position(member.get('position'))
-    
-    # Check if committee role already exists
-    existing = await conn.fetchval(
-        """
-        SELECT id FROM committee_roles
-        WHERE conference_id = $1 AND author_id = $2 AND committee = $3
-        """,
-        conference_id,
-        author_id,
-        db_committee
-    )
-    
-    if existing:
-        # Update position, affiliation, and role_title if different
-        await conn.execute(
-            """
-            UPDATE committee_roles
-            SET position = $1, affiliation = $2, role_title = $3, updated_at = NOW(), modifier = 'import_from_csv'
-            WHERE id = $4
-            """,
-            db_position,
+async def import_members(
+    session: ImportSession,
+    conference_id: UUID,
+    members: List[Dict[str, str]]
+) -> Dict[str, UUID]:
+    """Import committee members for one conference using batched queries.
+
+    A member whose (author, committee) role already exists has its position,
+    affiliation and role_title updated; otherwise a new role is inserted. When
+    the CSV lists the same (author, committee) twice, the later row wins.
+    Returns the author IDs the members resolved to, by normalized name.
+    """
+    member_names = [normalize_name(member['full_name']) for member in members]
+    author_ids = await resolve_authors(session, members, member_names)
+
+    # Map values to database enums; collapse repeated (author, committee) rows.
+    roles: Dict[Tuple[UUID, str], Tuple[str, Optional[str], Optional[str], Dict[str, str]]] = {}
+    for name, member in zip(member_names, members):
+        author_id = author_ids[name]
+        db_committee = map_committee_type(member['committee_type'])
+        roles[(author_id, db_committee)] = (
+            map_position(member.get('position')),
             member.get('affiliation'),
             member.get('role_title'),
-            existing
+            member,
         )
-        logger.debug(f"Updated existing role: {member['full_name']} - {member['committee_type']}")
-    else:
-        # Insert new role
-        await conn.execute(
-            """
-            INSERT INTO committee_roles (conference_id, author_id, committee, position, affiliation, role_title, creator, modifier)
-            VALUES ($1, $2, $3, $4, $5, $6, 'import_from_csv', 'import_from_csv')
-            """,
-            conference_id,
-            author_id,
-            db_committee,
-            db_position,
-            member.get('affiliation'),
-            member.get('role_title')
-        )
-        logger.info(f"Imported: {member['full_name']} - {member['committee_type']} ({member.get('position') or 'member'})")
-    
-    return True
+
+    params = [
+        (author_id, db_committee, db_position, affiliation, role_title)
+        for (author_id, db_committee), (db_position, affiliation, role_title, _) in roles.items()
+    ]
+    rows = await session.upsert_roles.fetch(
+        conference_id,
+        *(list(col) for col in zip(*params))
+    )
+
+    for row in rows:
+        member = roles[(row['author_id'], row['committee'])][3]
+        if row['inserted']:
+            logger.info(f"Imported: {member['full_name']} - {member['committee_type']} ({member.get('position') or 'member'})")
+        else:
+            logger.debug("Updated existing role: %s - %s", member['full_name'], member['committee_type'])
+
+    return author_ids
+
+
+def _conference_key(member: Dict[str, str]) -> Tuple[str, int]:
+    return member['venue'], int(member['year'])
 
 
 async def import_from_csv(
-    pool: asyncpg.Pool,
+    session: Optional[ImportSession],
     csv_file: Path,
     dry_run: bool = False
 ) -> tuple[int, int]:
-    """Import committee data from CSV file."""
-    
-    # Read CSV file
-    members = []
+    """Import committee data from CSV file. ``session`` is None on a dry run.
+
+    Rows are streamed from the file and imported ``_CHUNK_SIZE`` at a time
+    rather than loaded up front. Files normally cover one conference, but
+    each run of rows sharing a (venue, year) is resolved to its own
+    conference.
+    """
     with open(csv_file, 'r', encoding='utf-8', newline='') as f:
         reader = csv.DictReader(f)
-        members = list(reader)
-    
-    if not members:
-        logger.error("No members found in CSV file")
-        return 0, 0
-    
-    venue = members[0]['venue']
-    year = int(members[0]['year'])
-    
-    logger.info(f"Loaded {len(members)} members from {csv_file}")
-    logger.info(f"Conference: {venue} {year}")
-    
-    if dry_run:
-        logger.info("DRY RUN - would import:")
-        for member in members:
-            logger.info(f"  {member['full_name']} - {member['committee_type']} ({member.get('position') or 'member'})")
-        return len(members), 0
-    
-    # Import members
-    imported = 0
-    failed = 0
-    
-    async with pool.acquire() as conn:
-        async with conn.transaction():
-            for member in members:
-                try:
-                    success = await import_member(conn, venue, year, member)
-                    if success:
-                        imported += 1
-                    else:
-                        failed += 1
-                except Exception as e:
-                    logger.error(f"Error importing {member['full_name']}: {e}")
-                    failed += 1
-    
-    return imported, failed
+        first = next(reader, None)
+        if first is None:
+            logger.error("No members found in CSV file")
+            return 0, 0
+
+        members = itertools.chain([first], reader)
+        logger.info(f"Reading members from {csv_file}")
+
+        if dry_run:
+            logger.info("DRY RUN - would import:")
+            count = 0
+            for (venue, year), group in itertools.groupby(members, key=_conference_key):
+                logger.info(f"Conference: {venue} {year}")
+                for member in group:
+                    logger.info(f"  {member['full_name']} - {member['committee_type']} ({member.get('position') or 'member'})")
+                    count += 1
+            return count, 0
+
+        # Import all members in one transaction: either the whole file lands or
+        # none of it does. A file spanning several conferences takes the
+        # authors lock between two conference locks, so two such files can
+        # deadlock; postgres aborts one, and that file is imported again.
+        attempt = 1
+        while True:
+            count = 0
+            author_ids: Dict[str, UUID] = {}
+            locked = set()
+            try:
+                async with session.conn.transaction():
+                    while chunk := list(itertools.islice(members, _CHUNK_SIZE)):
+                        count += len(chunk)
+                        for (venue, year), group in itertools.groupby(chunk, key=_conference_key):
+                            conference_id = await get_conference_id(session, venue, year)
+                            if not conference_id:
+                                raise LookupError(f"Conference not found: {venue} {year}")
+                            if conference_id not in locked:
+                                logger.info(f"Conference: {venue} {year}")
+                                await session.lock_conference.fetchval(conference_id)
+                                locked.add(conference_id)
+                            author_ids.update(await import_members(session, conference_id, list(group)))
+                        logger.info(f"Imported {count} members from {csv_file}")
+                break
+            except Exception as e:
+                if isinstance(e, asyncpg.DeadlockDetectedError) and attempt < _DEADLOCK_ATTEMPTS:
+                    logger.warning(f"Deadlock importing {csv_file}, retrying: {e}")
+                    attempt += 1
+                    f.seek(0)
+                    members = csv.DictReader(f)
+                    continue
+                logger.error(f"Error importing {csv_file}: {e}")
+                return 0, count + sum(1 for _ in members)
+
+    session.author_ids.update(author_ids)
+    return count, 0
 
 
 def add_arguments(parser):
@@ -242,6 +376,8 @@ def add_arguments(parser):
                         help='Show what would be imported without actually importing')
     parser.add_argument('--db-url', type=str,
                         help='Database URL (default: from DATABASE_URL env var)')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Number of CSV files to import in parallel, one connection each (default: 1)')
 
 
 async def async_main(args) -> int:
@@ -253,6 +389,7 @@ async def async_main(args) -> int:
             logger.error(f"CSV file not found: {p}")
         return 1
 
+    jobs = max(1, min(args.jobs, len(csv_paths)))
     pool = None
     if not args.dry_run:
         load_dotenv()
@@ -261,7 +398,7 @@ async def async_main(args) -> int:
             logger.error("No database URL provided. Set DATABASE_URL or use --db-url")
             return 1
         try:
-            pool = await asyncpg.create_pool(db_url, min_size=1, max_size=5)
+            pool = await asyncpg.create_pool(db_url, min_size=jobs, max_size=jobs)
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             return 1
@@ -269,13 +406,30 @@ async def async_main(args) -> int:
     try:
         total_imported = 0
         total_failed = 0
+        pending = deque(csv_paths)
+        conference_ids: Dict[Tuple[str, int], Optional[UUID]] = {}
+        author_ids: Dict[str, UUID] = {}
 
-        for csv_path in csv_paths:
-            if len(csv_paths) > 1:
-                logger.info(f"--- Processing {csv_path} ---")
-            imported, failed = await import_from_csv(pool, csv_path, args.dry_run)
-            total_imported += imported
-            total_failed += failed
+        async def import_pending(session: Optional[ImportSession]) -> None:
+            nonlocal total_imported, total_failed
+            while pending:
+                csv_path = pending.popleft()
+                if len(csv_paths) > 1:
+                    logger.info(f"--- Processing {csv_path} ---")
+                imported, failed = await import_from_csv(session, csv_path, args.dry_run)
+                total_imported += imported
+                total_failed += failed
+
+        # Each worker holds one connection for the whole run, so its prepared
+        # statements stay valid from file to file.
+        async def worker() -> None:
+            async with pool.acquire() as conn:
+                await import_pending(await ImportSession.prepare(conn, conference_ids, author_ids))
+
+        if pool is None:
+            await import_pending(None)
+        else:
+            await asyncio.gather(*(worker() for _ in range(jobs)))
 
         if len(csv_paths) > 1:
             logger.info(f"--- Total across {len(csv_paths)} files ---")
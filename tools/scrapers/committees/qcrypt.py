@@ -1,11 +1,74 @@
 """QCrypt conference committee scraper."""
 import re
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from bs4 import Tag
+
+from ..base import BODY_ONLY
 from .base import BaseCommitteeScraper
 
+# "(Affiliation)" or "[Affiliation]"; _PAREN_STRIP_RE also eats the spaces around it
+_PAREN_RE = re.compile(r'[\(\[]([^\)\]]+)[\)\]]')
+_PAREN_STRIP_RE = re.compile(r'\s*[\(\[]([^\)\]]+)[\)\]]\s*')
+_EMAIL_RE = re.compile(r'\S+@\S+')
+# Trailing " – Chair" job description. Requires whitespace before the dash so
+# hyphenated names like Sheng-Kai are left alone.
+_DASH_RE = re.compile(r'\s+[–—-]\s*(.+)$')
+# "Name (Affiliation) rest" / "Name [Affiliation] rest"
+_NAME_AFFIL_RE = re.compile(r'^(.+?)\s*[\(\[]([^\)\]]+)[\)\]]\s*(.*)$')
+
+# Navigation links and section headings that turn up as short list items
+_NAV_TEXT_RE = re.compile(
+    'twitter|youtube|linkedin|steering committee|program committee|organizing committee'
+)
+
+# Marks a <p><em>/<strong> legacy committee heading
+_SECTION_WORD_RE = re.compile('committee|organizer|organiser')
+
+# Headings that end a committee section started by the key heading
+_STOP_HEADINGS = {
+    'h2': frozenset({'h2'}),
+    'h3': frozenset({'h2', 'h3'}),
+    'h4': frozenset({'h2', 'h3', 'h4'}),
+}
+
+# Substring matches, like the `in` checks they replace ('web' matches
+# 'website'). 'chair' also covers co-chair and area chair.
+_ROLE_WORD_RE = re.compile('chair|member')
+# Parenthesized role descriptions on local organizing committee entries
+_LOCAL_ROLE_RE = re.compile(
+    'webmaster|web|poster|session|dinner|coordinator|package|rump|support|visa'
+    '|registration|industry|student|general chair|lead|video|slides|magic'
+    '|contact|welcome'
+)
+
+
+def _chair_position(role_lower: str) -> str:
+    """'co-chair', 'chair' or 'member' for lower-cased role text."""
+    if 'co-chair' in role_lower or 'co chair' in role_lower:
+        return 'co-chair'
+    if 'chair' in role_lower:
+        return 'chair'
+    return 'member'
+
+
+def _split_dash_role(text: str) -> Tuple[str, str]:
+    """Split a trailing " – Role" off ``text``.
+
+    Returns the position it names and the text without it; ``('member',
+    text)`` if there is none.
+    """
+    match = _DASH_RE.search(text)
+    if not match:
+        return 'member', text
+    return _chair_position(match.group(1).lower()), text[:match.start()]
+
 
 class QCryptScraper(BaseCommitteeScraper):
     """Scraper for QCrypt conference committee pages."""
+
+    # Layouts vary too much by year to strain any tighter than <body>
+    parse_only = BODY_ONLY
     
     # Per-year subdirectory under qcrypt.iaqi.org/<year>/.
     # Matches the local mirror at ~/Web/qcrypt.iaqi.org/.
@@ -39,22 +102,18 @@ class QCryptScraper(BaseCommitteeScraper):
         # Also check for older formats:
         # 1. <p><em><span>Committee Name</span></em></p>
         # 2. <p><strong>Committee Name</strong></p>
-        # Look for both "committee" and "organizer" keywords
+        # Look for both "committee" and "organizer" keywords. The lower-cased
+        # <em>/<strong> text ('' when absent) is kept per <p>: legacy sections
+        # re-check it for every paragraph they walk past.
+        emphasis = {}
         for p in self.soup.find_all('p'):
-            # Check for <em> tag
             em = p.find('em')
-            if em:
-                em_text = em.get_text().lower()
-                if 'committee' in em_text or 'organizer' in em_text or 'organiser' in em_text:
-                    sections.append(p)
-                    continue
-            
-            # Check for <strong> tag
             strong = p.find('strong')
-            if strong:
-                strong_text = strong.get_text().lower()
-                if 'committee' in strong_text or 'organizer' in strong_text or 'organiser' in strong_text:
-                    sections.append(p)
+            em_text = em.get_text().lower() if em else ''
+            strong_text = strong.get_text().lower() if strong else ''
+            emphasis[id(p)] = (em_text, strong_text)
+            if _SECTION_WORD_RE.search(em_text) or _SECTION_WORD_RE.search(strong_text):
+                sections.append(p)
         
         for section_heading in sections:
             heading_text = section_heading.get_text().lower()
@@ -73,35 +132,23 @@ class QCryptScraper(BaseCommitteeScraper):
             if not committee_type:
                 continue
             
-            # Find the members section following this heading
-            current = section_heading
+            # Walk the element siblings after this heading, up to the next
+            # heading of the same or a higher level
             is_legacy_format = section_heading.name == 'p'
-            heading_level = section_heading.name if section_heading.name in ['h2', 'h3', 'h4'] else None
+            stop_at = _STOP_HEADINGS.get(section_heading.name, frozenset())
             
-            while current:
-                current = current.next_sibling
-                
+            for current in section_heading.next_siblings:
                 # Skip text nodes
-                if not hasattr(current, 'name') or current.name is None:
+                if not isinstance(current, Tag):
                     continue
                 
-                # Stop at next heading of same or higher level
-                if heading_level and current.name in ['h2', 'h3', 'h4']:
-                    # Stop if we hit h2 (always higher level)
-                    if current.name == 'h2':
-                        break
-                    # For h3 and h4, stop if same or higher level
-                    if heading_level == 'h3' and current.name in ['h3']:
-                        break
-                    if heading_level == 'h4' and current.name in ['h3', 'h4']:
-                        break
+                if current.name in stop_at:
+                    break
                 
                 # For legacy format, stop at next committee paragraph
                 if is_legacy_format and current.name == 'p':
-                    em = current.find('em')
-                    strong = current.find('strong')
-                    if (em and 'committee' in em.get_text().lower()) or \
-                       (strong and 'committee' in strong.get_text().lower()):
+                    em_text, strong_text = emphasis[id(current)]
+                    if 'committee' in em_text or 'committee' in strong_text:
                         break
                     
                     # Check if this is a paragraph with <br> separated names (2011 format)
@@ -114,7 +161,7 @@ class QCryptScraper(BaseCommitteeScraper):
                 member_section = None
                 if current.name == 'section' and 'members' in current.get('class', []):
                     member_section = current
-                elif hasattr(current, 'find'):
+                else:
                     member_section = current.find('section', class_='members', recursive=False)
                 
                 if member_section:
@@ -127,20 +174,17 @@ class QCryptScraper(BaseCommitteeScraper):
         
         return members
     
-    def _parse_member_section(self, section, committee_type: str, heading_text: str) -> List[Dict[str, str]]:
+    def _parse_member_section(self, section, committee_type: str, heading_text: str) -> Iterator[Dict[str, str]]:
         """Parse a <section class="members"> element."""
-        members = []
         member_list = section.find('ul', class_='members')
         
         if not member_list:
-            return members
+            return
         
         for li in member_list.find_all('li', recursive=False):
             member = self._parse_member_li(li, committee_type, heading_text)
             if member:
-                members.append(member)
-        
-        return members
+                yield member
     
     def _parse_member_li(self, li, committee_type: str, heading_text: str) -> Optional[Dict[str, str]]:
         """Parse a member <li> element with structured data."""
@@ -166,7 +210,7 @@ class QCryptScraper(BaseCommitteeScraper):
         for h4 in h4_tags:
             h4_text = h4.get_text(strip=True)
             # Role indicators
-            if any(kw in h4_text.lower() for kw in ['chair', 'member', 'co-chair', 'area chair']):
+            if _ROLE_WORD_RE.search(h4_text.lower()):
                 role_text = h4_text
             elif not affiliation:
                 affiliation = self.normalize_affiliation(h4_text)
@@ -185,10 +229,8 @@ class QCryptScraper(BaseCommitteeScraper):
             'role_title': role_title
         }
     
-    def _parse_plain_list(self, ul, committee_type: str, heading_text: str) -> List[Dict[str, str]]:
+    def _parse_plain_list(self, ul, committee_type: str, heading_text: str) -> Iterator[Dict[str, str]]:
         """Parse a plain <ul> list of members."""
-        members = []
-        
         for li in ul.find_all('li', recursive=False):
             # Check if there are anchor tags (newer format with links)
             anchors = li.find_all('a')
@@ -218,19 +260,19 @@ class QCryptScraper(BaseCommitteeScraper):
                 affiliation = None
                 
                 # Extract affiliation from parentheses or brackets in the name itself
-                paren_match = re.search(r'[\(\[]([^\)\]]+)[\)\]]', name)
+                paren_match = _PAREN_RE.search(name)
                 if paren_match:
                     affiliation = self.normalize_affiliation(paren_match.group(1))
-                    name = re.sub(r'\s*[\(\[]([^\)\]]+)[\)\]]\s*', '', name)
+                    name = _PAREN_STRIP_RE.sub('', name)
                 
                 # Also check remaining text for affiliation in parentheses/brackets
                 if not affiliation:
                     # Remove email-like patterns
-                    remaining_text = re.sub(r'\S+@\S+', '', remaining_text)
+                    remaining_text = _EMAIL_RE.sub('', remaining_text)
                     remaining_text = remaining_text.strip()
                     if remaining_text:
                         # Check for parentheses/brackets pattern for affiliation
-                        match = re.match(r'[\(\[]([^\)\]]+)[\)\]]', remaining_text)
+                        match = _PAREN_RE.match(remaining_text)
                         if match:
                             affiliation = self.normalize_affiliation(match.group(1))
                 
@@ -238,16 +280,7 @@ class QCryptScraper(BaseCommitteeScraper):
                 name = self.normalize_name(name)
                 
                 # Check if there's a chair designation after the dash
-                position = 'member'
-                # Only match dashes with whitespace before them (not hyphens in names)
-                dash_match = re.search(r'\s+[–—-]\s*(.+)$', remaining_text)
-                if dash_match:
-                    role_text = dash_match.group(1).strip().lower()
-                    # Check for chair designation
-                    if 'co-chair' in role_text or 'co chair' in role_text:
-                        position = 'co-chair'
-                    elif 'chair' in role_text:
-                        position = 'chair'
+                position, _ = _split_dash_role(remaining_text)
                 
                 # Override position detection if we didn't find chair in text
                 if position == 'member':
@@ -256,47 +289,30 @@ class QCryptScraper(BaseCommitteeScraper):
                 # Detect specialized role title
                 role_title = self.detect_role_title(remaining_text, heading_text)
                 
-                members.append({
+                yield {
                     'committee_type': committee_type,
                     'position': position,
                     'full_name': name,
                     'affiliation': affiliation,
                     'role_title': role_title
-                })
+                }
             else:
                 # Fallback to plain text parsing
                 text = li.get_text(' ', strip=True)
                 member = self._parse_plain_text(text, committee_type, heading_text)
                 if member:
-                    members.append(member)
-        
-        return members
+                    yield member
     
-    def _parse_br_separated_list(self, p_tag, committee_type: str, heading_text: str) -> List[Dict[str, str]]:
+    def _parse_br_separated_list(self, p_tag, committee_type: str, heading_text: str) -> Iterator[Dict[str, str]]:
         """Parse a <p> tag with <br> separated member names (2011 format).
         
         Example: <p>Name1<br />Name2 (chair)<br />Name3</p>
         """
-        members = []
-        
-        # Get the HTML content and split by <br> tags
-        # Replace <br> and <br/> tags with a delimiter
-        import re
-        html_content = str(p_tag)
-        # Split by <br> tags (various formats: <br>, <br/>, <br />)
-        parts = re.split(r'<br\s*/?>', html_content)
-        
-        for part in parts:
-            # Remove HTML tags and get clean text
-            from bs4 import BeautifulSoup
-            clean_text = BeautifulSoup(part, 'html.parser').get_text(strip=True)
-            
+        for clean_text in self.split_at_br(p_tag):
             if clean_text and len(clean_text) > 2:
                 member = self._parse_plain_text(clean_text, committee_type, heading_text)
                 if member:
-                    members.append(member)
-        
-        return members
+                    yield member
     
     def _parse_plain_text(self, text: str, committee_type: str, heading_text: str) -> Optional[Dict[str, str]]:
         """Parse member info from plain text."""
@@ -304,47 +320,29 @@ class QCryptScraper(BaseCommitteeScraper):
             return None
         
         # Skip navigation/header items
-        text_lower = text.lower()
-        blacklist = ['twitter', 'youtube', 'linkedin', 'steering committee', 
-                     'program committee', 'organizing committee']
-        if any(item in text_lower for item in blacklist) and len(text) < 100:
+        if len(text) < 100 and _NAV_TEXT_RE.search(text.lower()):
             return None
         
         # Check for chair designation in job description before removing it
-        position = 'member'
-        # Only match dashes with whitespace before them (not hyphens in names like Sheng-Kai)
-        dash_match = re.search(r'\s+[–—-]\s*(.+)$', text)
-        if dash_match:
-            role_text = dash_match.group(1).strip().lower()
-            if 'co-chair' in role_text or 'co chair' in role_text:
-                position = 'co-chair'
-            elif 'chair' in role_text:
-                position = 'chair'
-            # Remove job description after dash
-            text = re.sub(r'\s+[–—-]\s*.+$', '', text)
+        position, text = _split_dash_role(text)
         
         # Try to parse "Name (Affiliation)" or "Name [Affiliation]" or "Name, Affiliation" patterns
         name = text
         affiliation = None
         
         # Pattern: Name (Affiliation) or Name [Affiliation]
-        match = re.match(r'^(.+?)\s*[\(\[]([^\)\]]+)[\)\]]\s*(.*)$', text)
+        match = _NAME_AFFIL_RE.match(text)
         if match:
             name = self.normalize_name(match.group(1))
             paren_content = match.group(2)
             paren_lower = paren_content.lower()
             
             # Check if parentheses contain position/role information rather than affiliation
-            position_indicators = ['chair', 'co-chair', 'co chair']
-            is_position_info = any(indicator in paren_lower for indicator in position_indicators)
+            # ('chair' also covers co-chair / co chair)
+            is_position_info = 'chair' in paren_lower
             
             # For local organizing committees, check for broader role descriptions
-            role_keywords = ['webmaster', 'web', 'poster', 'session', 'dinner', 'coordinator',
-                           'package', 'rump', 'support', 'visa', 'registration', 'industry',
-                           'student', 'general chair', 'lead', 'video', 'slides',
-                           'magic', 'contact', 'welcome']
-            
-            if committee_type == 'local_organizing' and any(kw in paren_lower for kw in role_keywords):
+            if committee_type == 'local_organizing' and _LOCAL_ROLE_RE.search(paren_lower):
                 # This is role information, not affiliation
                 affiliation = None
                 # Check for chair/lead positions
@@ -355,10 +353,7 @@ class QCryptScraper(BaseCommitteeScraper):
             elif is_position_info:
                 # For any committee, if it's clearly a position (chair, co-chair), don't treat as affiliation
                 affiliation = None
-                if 'co-chair' in paren_lower or 'co chair' in paren_lower:
-                    position = 'co-chair'
-                elif 'chair' in paren_lower:
-                    position = 'chair'
+                position = _chair_position(paren_lower)
             else:
                 # This is affiliation information
                 affiliation = self.normalize_affiliation(paren_content)
@@ -367,7 +362,7 @@ class QCryptScraper(BaseCommitteeScraper):
             remaining = match.group(3).strip()
             if remaining and position == 'member':
                 # Look for position indicators like (lead organizer), (chair), etc.
-                extra_match = re.match(r'[\(\[]([^\)\]]+)[\)\]]', remaining)
+                extra_match = _PAREN_RE.match(remaining)
                 if extra_match:
                     role_text = extra_match.group(1).lower()
                     if 'lead' in role_text or 'chair' in role_text:
@@ -400,11 +395,4 @@ class QCryptScraper(BaseCommitteeScraper):
     
     def _detect_position(self, name: str, role_text: str, heading_text: str) -> str:
         """Detect the position/role of a committee member."""
-        combined = f"{heading_text} {role_text}".lower()
-        
-        if 'co-chair' in combined or 'co chair' in combined:
-            return 'co-chair'
-        elif 'chair' in combined:
-            return 'chair'
-        else:
-            return 'member'
+        return _chair_position(f"{heading_text} {role_text}".lower())
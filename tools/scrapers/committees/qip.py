@@ -1,11 +1,40 @@
 """QIP conference committee scraper."""
+import re
 from typing import List, Dict
+
+from bs4 import SoupStrainer
+
 from .base import BaseCommitteeScraper
 
+# Research-area words that mark "Topic: Name, Affiliation" topic-chair lines
+_TOPIC_RE = re.compile(
+    'quantum|cryptography|complexity|theory|tomography|learning|error correction|foundations'
+)
+
+
+# Section headers: (phrases, committee_type, position, chair role_title).
+# Earlier entries win when a header contains phrases from several. Chair
+# headers carry the member on the same line ("... Chair: Name, Affiliation").
+_HEADERS = (
+    (('program committee chair', 'programme committee chair'), 'program', 'chair', 'Program Chair'),
+    (('topic chair', 'area chair'), 'program', 'area_chair', None),
+    (('technical operations chair',), 'program', 'chair', 'Technical Operations Chair'),
+    (('full program committee', 'programme committee'), 'program', 'member', None),
+    (('steering committee',), 'steering', 'member', None),
+    (('organizing', 'local'), 'local_organizing', 'member', None),
+)
+# One group per _HEADERS entry inside a lookahead, so finditer sees
+# overlapping phrases and m.lastindex names the entry
+_HEADER_RE = re.compile('(?=' + '|'.join(
+    '(' + '|'.join(map(re.escape, phrases)) + ')' for phrases, *_ in _HEADERS
+) + ')')
+
 
 class QIPScraper(BaseCommitteeScraper):
     """Scraper for QIP conference committee pages."""
-    
+
+    parse_only = SoupStrainer('div', class_='ce-bodytext')
+
     def get_url(self) -> str:
         """Return the URL for QIP committee page."""
         # QIP 2026 has multiple pages for different committees
@@ -37,48 +66,17 @@ class QIPScraper(BaseCommitteeScraper):
             if strong:
                 header_text = strong.get_text().lower()
                 
-                if 'program committee chair' in header_text or 'programme committee chair' in header_text:
-                    current_committee_type = 'program'
-                    current_position = 'chair'
-                    # Extract the chair from this same paragraph
-                    text = p.get_text()
-                    if ':' in text:
-                        chair_info = text.split(':', 1)[1].strip()
-                        member = self._parse_member_text(chair_info, current_committee_type, current_position, role_title='Program Chair')
-                        if member:
-                            members.append(member)
-                    continue
-                
-                elif 'topic chair' in header_text or 'area chair' in header_text:
-                    current_committee_type = 'program'
-                    current_position = 'area_chair'
-                    continue
-                
-                elif 'technical operations chair' in header_text:
-                    current_committee_type = 'program'
-                    current_position = 'chair'
-                    # Extract the chair from this same paragraph
-                    text = p.get_text()
-                    if ':' in text:
-                        chair_info = text.split(':', 1)[1].strip()
-                        member = self._parse_member_text(chair_info, current_committee_type, current_position, role_title='Technical Operations Chair')
-                        if member:
-                            members.append(member)
-                    continue
-                
-                elif 'full program committee' in header_text or 'programme committee' in header_text:
-                    current_committee_type = 'program'
-                    current_position = 'member'
-                    continue
-                
-                elif 'steering committee' in header_text:
-                    current_committee_type = 'steering'
-                    current_position = 'member'
-                    continue
-                
-                elif 'organizing' in header_text or 'local' in header_text:
-                    current_committee_type = 'local_organizing'
-                    current_position = 'member'
+                matched = {m.lastindex for m in _HEADER_RE.finditer(header_text)}
+                if matched:
+                    _, current_committee_type, current_position, chair_title = _HEADERS[min(matched) - 1]
+                    if chair_title:
+                        # Extract the chair from this same paragraph
+                        text = p.get_text()
+                        if ':' in text:
+                            chair_info = text.split(':', 1)[1].strip()
+                            member = self._parse_member_text(chair_info, current_committee_type, current_position, role_title=chair_title)
+                            if member:
+                                members.append(member)
                     continue
             
             # Skip if we don't know what committee this is
@@ -88,17 +86,7 @@ class QIPScraper(BaseCommitteeScraper):
             # Parse members from <br> separated list
             # Check if this paragraph contains <br> tags
             if p.find('br'):
-                # Get HTML content and split by <br>
-                html = str(p)
-                # Split by <br> or <br/>
-                import re
-                parts = re.split(r'<br\s*/?>', html)
-                
-                for part in parts:
-                    # Remove HTML tags
-                    from bs4 import BeautifulSoup
-                    clean_text = BeautifulSoup(part, 'html.parser').get_text(strip=True)
-                    
+                for clean_text in self.split_at_br(p):
                     if clean_text and len(clean_text) > 3:
                         member = self._parse_member_text(clean_text, current_committee_type, current_position)
                         if member:
@@ -116,7 +104,7 @@ class QIPScraper(BaseCommitteeScraper):
         text = text.replace('&nbsp;', ' ').strip()
         
         # Check if it's a role line (e.g., "Quantum algorithms: Name, Affiliation")
-        if ':' in text and any(keyword in text.lower() for keyword in ['quantum', 'cryptography', 'complexity', 'theory', 'tomography', 'learning', 'error correction', 'foundations']):
+        if ':' in text and _TOPIC_RE.search(text.lower()):
             # This is a topic chair line
             parts = text.split(':', 1)
             if len(parts) == 2:
@@ -1,11 +1,12 @@
 """CLI body for `scrape_to_csv.py committees` — fetch committee CSVs."""
 import argparse
+import asyncio
 import csv
 import logging
 from pathlib import Path
 from typing import Dict, List
 
-from .._lib import get_archive_url, url_to_local_path
+from .._lib import close_pool, get_archive_url, url_to_local_path
 from . import QCryptScraper, QIPScraper, TQCScraper
 
 logger = logging.getLogger(__name__)
@@ -19,6 +20,9 @@ _VENUES = {
     'TQC': TQCScraper,
 }
 
+# Upper bound on pages fetched at once in a --venues/--years batch.
+_MAX_CONCURRENT_SCRAPES = 10
+
 
 def save_to_csv(venue: str, year: int, members: List[Dict[str, str]],
                 output_dir: Path, force: bool = False) -> Path:
@@ -33,28 +37,55 @@ def save_to_csv(venue: str, year: int, members: List[Dict[str, str]],
         logger.warning("Use --force to overwrite")
         return None
 
-    for member in members:
-        member['venue'] = venue.upper()
-        member['year'] = year
-
-    fieldnames = ['venue', 'year', 'committee_type', 'position',
-                  'full_name', 'affiliation', 'role_title']
+    fieldnames = ('venue', 'year', 'committee_type', 'position',
+                  'full_name', 'affiliation', 'role_title')
+    venue = venue.upper()
+    rows = [
+        (venue, year, m.get('committee_type'), m.get('position'),
+         m.get('full_name'), m.get('affiliation'), m.get('role_title'))
+        for m in members
+    ]
 
-    with open(output_file, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(members)
+    with open(output_file, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
 
     logger.info(f"Saved {len(members)} members to {output_file}")
     return output_file
 
 
+def _venue_list(value: str) -> List[str]:
+    venues = [v.strip().upper() for v in value.split(',') if v.strip()]
+    unknown = [v for v in venues if v not in _VENUES]
+    if unknown or not venues:
+        raise argparse.ArgumentTypeError(
+            f"invalid venue(s) {', '.join(unknown) or value!r} (choose from {', '.join(_VENUES)})")
+    return venues
+
+
+def _year_list(value: str) -> List[int]:
+    try:
+        years = [int(y) for y in value.split(',') if y.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid year list: {value!r}")
+    if not years:
+        raise argparse.ArgumentTypeError(f"invalid year list: {value!r}")
+    return years
+
+
 def add_arguments(parser: argparse.ArgumentParser) -> None:
     """Wire CLI flags onto ``parser``. Used by the unified entry point."""
-    parser.add_argument('--venue', required=True, choices=list(_VENUES.keys()),
-                        help='Conference venue')
-    parser.add_argument('--year', type=int, required=True,
-                        help='Conference year')
+    venue_group = parser.add_mutually_exclusive_group(required=True)
+    venue_group.add_argument('--venue', choices=list(_VENUES.keys()),
+                             help='Conference venue')
+    venue_group.add_argument('--venues', type=_venue_list,
+                             help='Comma-separated venues to scrape in one batch, e.g. QIP,TQC')
+    year_group = parser.add_mutually_exclusive_group(required=True)
+    year_group.add_argument('--year', type=int,
+                            help='Conference year')
+    year_group.add_argument('--years', type=_year_list,
+                            help='Comma-separated years; every venue is scraped for every year')
     parser.add_argument('--local', action='store_true',
                         help='Use local HTML file instead of fetching from web')
     parser.add_argument('--local-file', type=str,
@@ -68,27 +99,67 @@ def add_arguments(parser: argparse.ArgumentParser) -> None:
 
 
 async def async_main(args: argparse.Namespace) -> int:
-    """Run the committee scrape end-to-end. Returns shell exit code."""
-    url = await get_archive_url(args.venue, args.year,
-                                ['archive_pc_url', 'archive_organizers_url'])
-    scraper_class = _VENUES[args.venue.upper()]
-
-    if not url:
-        logger.info("Using scraper's default URL")
-        try:
-            url = scraper_class(year=args.year).get_url()
-        except NotImplementedError as e:
-            logger.error(str(e))
-            return 1
+    """Run the committee scrape end-to-end. Returns shell exit code.
+
+    With ``--venues``/``--years`` every (venue, year) pair is scraped
+    concurrently; the exit code is non-zero if any of them failed.
+    """
+    venues = args.venues or [args.venue]
+    years = args.years or [args.year]
+    pairs = [(venue, year) for venue in venues for year in years]
+
+    if args.local_file and len(pairs) > 1:
+        logger.error("--local-file can only be used with a single venue and year")
+        return 1
+
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SCRAPES)
+    try:
+        results = await asyncio.gather(
+            *(_scrape(venue, year, args, semaphore) for venue, year in pairs),
+            return_exceptions=True,
+        )
+    finally:
+        await close_pool()
+
+    failed = []
+    for (venue, year), result in zip(pairs, results):
+        if isinstance(result, BaseException):
+            logger.error(f"{venue} {year}: {result}")
+        if result != 0:
+            failed.append(f"{venue} {year}")
+
+    if len(pairs) > 1:
+        logger.info(f"Scraped {len(pairs) - len(failed)}/{len(pairs)} conferences")
+        if failed:
+            logger.warning(f"Failed: {', '.join(failed)}")
+    return 1 if failed else 0
+
+
+async def _scrape(venue: str, year: int, args: argparse.Namespace,
+                  semaphore: asyncio.Semaphore) -> int:
+    """Scrape one venue/year and save its CSV. Returns shell exit code."""
+    scraper_class = _VENUES[venue.upper()]
 
     local_file = None
-    if args.local:
-        if args.local_file:
-            local_file = args.local_file
-        else:
-            local_dir = Path(args.local_dir).expanduser() if args.local_dir else Path.home() / 'Web'
+    if args.local and args.local_file:
+        # An explicit file needs no URL, so don't touch the database
+        local_file = args.local_file
+    else:
+        url = await get_archive_url(venue, year,
+                                    ['archive_pc_url', 'archive_organizers_url'])
+        if not url:
+            logger.info("Using scraper's default URL")
+            try:
+                url = scraper_class(year=year).get_url()
+            except NotImplementedError as e:
+                logger.error(str(e))
+                return 1
+
+        if args.local:
+            local_dir = Path(args.local_dir).expanduser() if args.local_dir else None
             local_file = url_to_local_path(url, local_dir)
 
+    if local_file:
         if not Path(local_file).exists():
             logger.error(f"Local file not found: {local_file}")
             return 1
@@ -96,10 +167,13 @@ async def async_main(args: argparse.Namespace) -> int:
         logger.info(f"Using local file: {local_file}")
 
     try:
-        scraper = scraper_class(year=args.year, local_file=local_file)
-        logger.info(f"Scraping {args.venue} {args.year} committee data...")
-        members = scraper.scrape()
-        logger.info(f"Found {len(members)} committee members")
+        scraper = scraper_class(year=year, local_file=local_file)
+        logger.info(f"Scraping {venue} {year} committee data...")
+        # scrape() does a blocking requests.get(); run it off the loop so a
+        # batch's fetches overlap
+        async with semaphore:
+            members = await asyncio.to_thread(scraper.scrape)
+        logger.info(f"Found {len(members)} committee members for {venue} {year}")
 
         if not members:
             logger.warning("No members found. Check the HTML structure and scraper implementation.")
@@ -118,11 +192,11 @@ async def async_main(args: argparse.Namespace) -> int:
 
     try:
         output_dir = Path(args.output_dir)
-        output_file = save_to_csv(args.venue, args.year, members, output_dir, args.force)
+        output_file = save_to_csv(venue, year, members, output_dir, args.force)
         if not output_file:
             return 1
 
-        logger.info(f"✓ Successfully saved committee data for {args.venue} {args.year}")
+        logger.info(f"✓ Successfully saved committee data for {venue} {year}")
         logger.info(f"Review the data in: {output_file}")
         logger.info("After verification, you can import using import_from_csv.py")
         return 0
@@ -11,15 +11,25 @@ import logging
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-from scrapers.committees import importer as committees_importer  # noqa: E402
-from scrapers.talks import importer as talks_importer  # noqa: E402
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-)
+# uvloop trims asyncio overhead around asyncpg's many small queries. It's
+# in requirements.txt, but has no Windows build; the stock loop works the
+# same, just slower.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+if __package__:
+    # Imported as part of the package (`python -m scrapers.import_from_csv`
+    # from tools/, or by another driver) — no path juggling needed.
+    from .committees import importer as committees_importer
+    from .talks import importer as talks_importer
+else:
+    # Run as a script from a checkout that isn't on PYTHONPATH — make
+    # `scrapers` importable.
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from scrapers.committees import importer as committees_importer
+    from scrapers.talks import importer as talks_importer
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -39,9 +49,14 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def main() -> int:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+    )
     args = build_parser().parse_args()
     importer = committees_importer if args.kind == 'committees' else talks_importer
-    return asyncio.run(importer.async_main(args)) or 0
+    run = uvloop.run if uvloop is not None else asyncio.run
+    return run(importer.async_main(args)) or 0
 
 
 if __name__ == '__main__':
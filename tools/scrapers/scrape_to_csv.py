@@ -3,6 +3,7 @@
 
 Examples:
     ./scrape_to_csv.py committees --venue QIP --year 2024 --local
+    ./scrape_to_csv.py committees --venues QIP,TQC --years 2023,2024
     ./scrape_to_csv.py talks --venue QCRYPT --year 2023 --local
 """
 import argparse
@@ -11,17 +12,17 @@ import logging
 import sys
 from pathlib import Path
 
-# Allow `python tools/scrapers/scrape_to_csv.py …` from a checkout that
-# isn't on PYTHONPATH — make `scrapers` importable.
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-from scrapers.committees import runner as committees_runner  # noqa: E402
-from scrapers.talks import runner as talks_runner  # noqa: E402
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-)
+if __package__:
+    # Imported as part of the package (`python -m scrapers.scrape_to_csv`
+    # from tools/, or by another driver) — no path juggling needed.
+    from .committees import runner as committees_runner
+    from .talks import runner as talks_runner
+else:
+    # Run as a script from a checkout that isn't on PYTHONPATH — make
+    # `scrapers` importable.
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from scrapers.committees import runner as committees_runner
+    from scrapers.talks import runner as talks_runner
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -41,6 +42,10 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def main() -> int:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+    )
     args = build_parser().parse_args()
     runner = committees_runner if args.kind == 'committees' else talks_runner
     return asyncio.run(runner.async_main(args)) or 0
@@ -1,19 +1,25 @@
 """CLI body for `import_from_csv.py talks` — import talk CSVs into the DB."""
 
+import asyncio
 import csv
+import hashlib
 import logging
 import os
 import re
 import json
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, List, Dict
-from uuid import UUID
-from datetime import datetime
+from uuid import UUID, uuid4
+from datetime import date, datetime, time
 
 import asyncpg
+from asyncpg.prepared_stmt import PreparedStatement
+from dateutil import parser as date_parser
 from dotenv import load_dotenv
 
-from scrapers._lib import normalize_name, split_name
+from scrapers._lib import normalize_name, split_normalized_name
 
 
 logging.basicConfig(
@@ -39,51 +45,165 @@ def generate_canonical_key(venue: str, year: int, paper_type: str, index: int) -
     return f"{venue}{year}-{paper_type}-{index}"
 
 
+def talk_import_hash(conference_id: UUID, talk: Dict[str, str], csv_filename: str) -> bytes:
+    """Digest of a talk's CSV row and where it goes, stored as ``import_hash``.
+
+    A publication whose stored digest matches is skipped on re-import, even
+    if it was edited since through the API: only the CSV row is compared.
+    NULL a publication's ``import_hash`` to force its rewrite, or bump the
+    version prefix when the row-to-database mapping changes, so every talk
+    gets rewritten once.
+    """
+    payload = json.dumps(['v1', str(conference_id), csv_filename, list(talk.items())])
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+
+def _parse_date(value: str, fmt: str) -> date:
+    """Parse ``value`` as ``fmt``, falling back to dateutil for other spellings."""
+    try:
+        return datetime.strptime(value, fmt).date()
+    except ValueError:
+        return date_parser.parse(value).date()
+
+
+def parse_schedule(talk: Dict[str, str], year: int) -> tuple[Optional[date], Optional[time], Optional[int]]:
+    """Parse a talk's (talk_date, talk_time, duration_minutes); unparseable fields are None."""
+    talk_date = None
+    if talk.get('scheduled_date'):
+        try:
+            date_str = talk['scheduled_date'].strip()
+            # If date already includes year (YYYY-MM-DD format), use as-is
+            # Otherwise assume it's "DD Month" format and append year
+            if _ISO_DATE_RE.match(date_str):
+                talk_date = _parse_date(date_str, '%Y-%m-%d')
+            else:
+                talk_date = _parse_date(f"{date_str} {year}", '%d %B %Y')
+        except Exception as e:
+            logger.warning(f"Could not parse date '{talk.get('scheduled_date')}': {e}")
+
+    talk_time = None
+    if talk.get('scheduled_time'):
+        try:
+            # Try the common HH:MM first, then with seconds (HH:MM:SS)
+            try:
+                talk_time = datetime.strptime(talk['scheduled_time'], '%H:%M').time()
+            except ValueError:
+                talk_time = datetime.strptime(talk['scheduled_time'], '%H:%M:%S').time()
+        except Exception as e:
+            logger.warning(f"Could not parse time '{talk.get('scheduled_time')}': {e}")
+
+    duration_minutes = None
+    # Check both 'duration_minutes' and 'duration' fields
+    duration_value = talk.get('duration_minutes') or talk.get('duration')
+    if duration_value:
+        try:
+            duration_minutes = int(duration_value)
+        except (ValueError, TypeError):
+            pass
+
+    return talk_date, talk_time, duration_minutes
+
+
+# Statements of the per-talk path; see TalkStatements
+
+# One round trip per author. normalized_name is deliberately not unique
+# (see the author_variant_lower_index migration), so this can't be an
+# INSERT ... ON CONFLICT: the first CTE finds the author by name or variant,
+# the second refreshes a found author's affiliation, and the third inserts
+# the author only if none was found.
+_GET_OR_CREATE_AUTHOR_SQL = """
+    WITH found AS (
+        SELECT id FROM authors WHERE normalized_name = $4
+        UNION ALL
+        SELECT author_id FROM author_name_variants WHERE LOWER(variant_name) = $4
+        LIMIT 1
+    ), updated AS (
+        UPDATE authors
+        SET affiliation = $5
+        WHERE id = (SELECT id FROM found) AND $5 <> ''
+          AND (affiliation IS NULL OR affiliation != $5)
+    ), inserted AS (
+        INSERT INTO authors (full_name, family_name, given_name, normalized_name, affiliation, creator, modifier)
+        SELECT $1, $2, $3, $4, $5, 'import_from_csv', 'import_from_csv'
+        WHERE NOT EXISTS (SELECT 1 FROM found)
+        RETURNING id
+    )
+    SELECT id, FALSE AS created FROM found
+    UNION ALL
+    SELECT id, TRUE FROM inserted
+"""
+
+_GET_PUBLICATION_SQL = "SELECT id, import_hash FROM publications WHERE canonical_key = $1"
+
+_INSERT_PUBLICATION_SQL = """
+    INSERT INTO publications (
+        conference_id, canonical_key, title, abstract, paper_type,
+        arxiv_ids, session_name, presentation_url, video_url, youtube_id,
+        award, metadata, talk_date, talk_time, duration_minutes, import_hash,
+        creator, modifier
+    ) VALUES (
+        $1, $2, $3, $4, $5::paper_type,
+        $6, $7, $8, $9, $10,
+        $11, $12, $13, $14, $15, $16,
+        'import_from_csv', 'import_from_csv'
+    ) RETURNING id
+"""
+
+_UPDATE_PUBLICATION_SQL = """
+    UPDATE publications
+    SET title = $1, abstract = $2, paper_type = $3::paper_type,
+        arxiv_ids = $4, session_name = $5, presentation_url = $6,
+        video_url = $7, youtube_id = $8, award = $9,
+        metadata = $10, talk_date = $11, talk_time = $12, duration_minutes = $13,
+        import_hash = $15, updated_at = NOW(), modifier = 'import_from_csv'
+    WHERE id = $14
+"""
+
+_SET_PRESENTER_SQL = "UPDATE publications SET presenter_author_id = $1 WHERE id = $2"
+
+
+@dataclass
+class TalkStatements:
+    """The per-talk path's statements, prepared once on a connection.
+
+    Used when a file falls back to importing talk by talk, so each statement
+    is parsed and planned once per file rather than once per talk or author.
+    """
+    get_or_create_author: PreparedStatement
+    get_publication: PreparedStatement
+    insert_publication: PreparedStatement
+    update_publication: PreparedStatement
+    delete_stale_authorships: PreparedStatement
+    upsert_authorships: PreparedStatement
+    set_presenter: PreparedStatement
+
+    @classmethod
+    async def prepare(cls, conn: asyncpg.Connection) -> 'TalkStatements':
+        """Prepare the statements on ``conn``."""
+        return cls(
+            get_or_create_author=await conn.prepare(_GET_OR_CREATE_AUTHOR_SQL),
+            get_publication=await conn.prepare(_GET_PUBLICATION_SQL),
+            insert_publication=await conn.prepare(_INSERT_PUBLICATION_SQL),
+            update_publication=await conn.prepare(_UPDATE_PUBLICATION_SQL),
+            delete_stale_authorships=await conn.prepare(_DELETE_STALE_AUTHORSHIPS_SQL),
+            upsert_authorships=await conn.prepare(_UPSERT_AUTHORSHIPS_SQL),
+            set_presenter=await conn.prepare(_SET_PRESENTER_SQL),
+        )
+
+
 async def get_or_create_author(
-    conn: asyncpg.Connection,
+    statements: TalkStatements,
     full_name: str,
     affiliation: Optional[str]
 ) -> UUID:
     """Get existing author or create new one."""
-    family_name, given_name = split_name(full_name)
-    normalized_full = normalize_name(full_name).lower()
-
-    # Try to find existing author by normalized_name
-    author_id = await conn.fetchval(
-        """
-        SELECT a.id FROM authors a
-        LEFT JOIN author_name_variants v ON a.id = v.author_id
-        WHERE a.normalized_name = $1
-           OR LOWER(v.variant_name) = $1
-        LIMIT 1
-        """,
-        normalized_full
-    )
-
-    if author_id:
-        logger.debug(f"Found existing author: {full_name} -> {author_id}")
-
-        # Update affiliation if provided and different
-        if affiliation:
-            await conn.execute(
-                """
-                UPDATE authors
-                SET affiliation = $1
-                WHERE id = $2 AND (affiliation IS NULL OR affiliation != $1)
-                """,
-                affiliation,
-                author_id
-            )
-
-        return author_id
+    normalized_full = normalize_name(full_name)
+    family_name, given_name = split_normalized_name(normalized_full)
 
-    # Create new author
-    author_id = await conn.fetchval(
-        """
-        INSERT INTO authors (full_name, family_name, given_name, normalized_name, affiliation, creator, modifier)
-        VALUES ($1, $2, $3, $4, $5, 'import_from_csv', 'import_from_csv')
-        RETURNING id
-        """,
+    author_id, created = await statements.get_or_create_author.fetchrow(
         full_name,
         family_name,
         given_name,
@@ -91,10 +211,98 @@ async def get_or_create_author(
         affiliation
     )
 
-    logger.info(f"Created new author: {full_name} ({author_id})")
+    if created:
+        logger.info(f"Created new author: {full_name} ({author_id})")
+    else:
+        logger.debug("Found existing author: %s -> %s", full_name, author_id)
     return author_id
 
 
+_FIND_AUTHORS_SQL = """
+    SELECT a.normalized_name AS name, a.id FROM authors a
+    WHERE a.normalized_name = ANY($1::text[])
+    UNION ALL
+    SELECT LOWER(v.variant_name), v.author_id FROM author_name_variants v
+    WHERE LOWER(v.variant_name) = ANY($1::text[])
+"""
+
+# New authors are loaded with COPY, with IDs generated here since COPY
+# can't return the column defaults.
+_AUTHOR_COPY_COLUMNS = [
+    'id', 'full_name', 'family_name', 'given_name', 'normalized_name', 'affiliation', 'creator', 'modifier'
+]
+
+_UPDATE_AFFILIATIONS_SQL = """
+    UPDATE authors a
+    SET affiliation = u.affiliation
+    FROM unnest($1::uuid[], $2::text[]) AS u(id, affiliation)
+    WHERE a.id = u.id AND (a.affiliation IS NULL OR a.affiliation != u.affiliation)
+"""
+
+# Transaction-scoped advisory locks for concurrent imports (--jobs). Files
+# for the same conference take turns, and so do files that create authors:
+# the second one waits for the first to commit and then finds its authors
+# instead of inserting duplicates. The authors lock is the committee
+# importer's, so the two importers don't race each other either.
+_LOCK_CONFERENCE_SQL = "SELECT pg_advisory_xact_lock(hashtext('publications'), hashtext($1::uuid::text))"
+_LOCK_AUTHORS_SQL = "SELECT pg_advisory_xact_lock(hashtext('authors'), 0)"
+
+
+async def resolve_authors(
+    conn: asyncpg.Connection,
+    people: List[tuple[str, str, Optional[str]]],
+    known_authors: Dict[str, UUID]
+) -> Dict[str, UUID]:
+    """Batched ``get_or_create_author`` for ``(normalized_name, full_name, affiliation)`` triples.
+
+    Names in ``known_authors`` skip the lookup; the rest are looked up in one
+    query and the missing ones created with one COPY. As with one
+    ``get_or_create_author`` call per triple, a new author takes its first
+    triple's name and affiliation, and the last non-empty affiliation wins.
+    """
+    first_seen: Dict[str, tuple[str, str, Optional[str]]] = {}
+    for person in people:
+        first_seen.setdefault(person[0], person)
+
+    author_ids = {name: known_authors[name] for name in first_seen if name in known_authors}
+    unknown = [name for name in first_seen if name not in author_ids]
+    if unknown:
+        for row in await conn.fetch(_FIND_AUTHORS_SQL, unknown):
+            author_ids.setdefault(row['name'], row['id'])
+
+    missing = [name for name in first_seen if name not in author_ids]
+    if missing:
+        # Another import may have created some of them while we waited.
+        await conn.execute(_LOCK_AUTHORS_SQL)
+        for row in await conn.fetch(_FIND_AUTHORS_SQL, missing):
+            author_ids.setdefault(row['name'], row['id'])
+        missing = [name for name in first_seen if name not in author_ids]
+
+    if missing:
+        new_rows = []
+        for name in missing:
+            _, full_name, affiliation = first_seen[name]
+            family_name, given_name = split_normalized_name(name)
+            new_rows.append((uuid4(), full_name, family_name, given_name, name,
+                             affiliation, 'import_from_csv', 'import_from_csv'))
+        await conn.copy_records_to_table('authors', records=new_rows, columns=_AUTHOR_COPY_COLUMNS)
+        for author_id, full_name, _, _, name, *_ in new_rows:
+            author_ids[name] = author_id
+            logger.info(f"Created new author: {full_name} ({author_id})")
+
+    # The triples that created an author already wrote their affiliation
+    created_by = {id(first_seen[name]) for name in missing}
+    affiliations: Dict[UUID, str] = {}
+    for person in people:
+        name, _, affiliation = person
+        if affiliation and id(person) not in created_by:
+            affiliations[author_ids[name]] = affiliation
+    if affiliations:
+        await conn.execute(_UPDATE_AFFILIATIONS_SQL, list(affiliations), list(affiliations.values()))
+
+    return author_ids
+
+
 async def get_conference_id(
     conn: asyncpg.Connection,
     venue: str,
@@ -109,8 +317,8 @@ async def get_conference_id(
 
 
 async def import_talk(
-    conn: asyncpg.Connection,
-    venue: str,
+    statements: TalkStatements,
+    conference_id: UUID,
     year: int,
     talk: Dict[str, str],
     canonical_key: str,
@@ -119,12 +327,6 @@ async def import_talk(
 ) -> bool:
     """Import a single talk with authors."""
 
-    # Get conference
-    conference_id = await get_conference_id(conn, venue, year)
-    if not conference_id:
-        logger.error(f"Conference not found: {venue} {year}")
-        return False
-
     # Parse list fields
     speakers = parse_semicolon_list(talk.get('speakers', ''))
     authors = parse_semicolon_list(talk.get('authors', ''))
@@ -139,69 +341,30 @@ async def import_talk(
         logger.warning(f"No authors for talk: {talk.get('title', 'unknown')}")
         return False
 
-    # Check if publication already exists
-    existing = await conn.fetchval(
-        "SELECT id FROM publications WHERE canonical_key = $1",
-        canonical_key
-    )
+    # Check if publication already exists, and whether its row changed
+    import_hash = talk_import_hash(conference_id, talk, csv_filename)
+    row = await statements.get_publication.fetchrow(canonical_key)
+    if row and row['import_hash'] == import_hash:
+        logger.info(f"Unchanged: {talk.get('title')}")
+        return True
+    existing = row['id'] if row else None
 
     publication_id = None
 
-    # Add source info to metadata
-    enriched_metadata = {
+    # Add source info to metadata; serialized once for the publication and
+    # all of its authorships
+    metadata_json = json.dumps({
         **source_metadata,
         'csv_file': csv_filename
-    }
+    })
 
     # Parse schedule fields
-    talk_date = None
-    if talk.get('scheduled_date'):
-        try:
-            from dateutil import parser
-            date_str = talk['scheduled_date'].strip()
-            # If date already includes year (YYYY-MM-DD format), use as-is
-            # Otherwise assume it's "DD Month" format and append year
-            if re.match(r'^\d{4}-\d{2}-\d{2}', date_str):
-                talk_date = parser.parse(date_str).date()
-            else:
-                date_str = f"{date_str} {year}"
-                talk_date = parser.parse(date_str).date()
-        except Exception as e:
-            logger.warning(f"Could not parse date '{talk.get('scheduled_date')}': {e}")
-
-    talk_time = None
-    if talk.get('scheduled_time'):
-        try:
-            # Try parsing with seconds first (HH:MM:SS), then without (HH:MM)
-            try:
-                talk_time = datetime.strptime(talk['scheduled_time'], '%H:%M:%S').time()
-            except ValueError:
-                talk_time = datetime.strptime(talk['scheduled_time'], '%H:%M').time()
-        except Exception as e:
-            logger.warning(f"Could not parse time '{talk.get('scheduled_time')}': {e}")
-
-    duration_minutes = None
-    # Check both 'duration_minutes' and 'duration' fields
-    duration_value = talk.get('duration_minutes') or talk.get('duration')
-    if duration_value:
-        try:
-            duration_minutes = int(duration_value)
-        except (ValueError, TypeError):
-            pass
+    talk_date, talk_time, duration_minutes = parse_schedule(talk, year)
 
     if existing:
-        logger.debug(f"Publication exists: {canonical_key}, updating...")
+        logger.debug("Publication exists: %s, updating...", canonical_key)
         # Update publication
-        await conn.execute(
-            """
-            UPDATE publications
-            SET title = $1, abstract = $2, paper_type = $3::paper_type,
-                arxiv_ids = $4, session_name = $5, presentation_url = $6,
-                video_url = $7, youtube_id = $8, award = $9,
-                metadata = $10, talk_date = $11, talk_time = $12, duration_minutes = $13,
-                updated_at = NOW(), modifier = 'import_from_csv'
-            WHERE id = $14
-            """,
+        await statements.update_publication.fetch(
             talk.get('title'),
             talk.get('abstract') or None,
             talk.get('paper_type'),
@@ -211,45 +374,28 @@ async def import_talk(
             talk.get('video_url') or None,
             talk.get('youtube_id') or None,
             talk.get('award') or None,
-            json.dumps(enriched_metadata),
+            metadata_json,
             talk_date,
             talk_time,
             duration_minutes,
-            existing
+            existing,
+            import_hash
         )
         publication_id = existing
     else:
         # Insert new publication
-        publication_id = await conn.fetchval(
-            """
-            INSERT INTO publications (
-                conference_id, canonical_key, title, abstract, paper_type,
-                arxiv_ids, session_name, presentation_url, video_url, youtube_id,
-                award, metadata, talk_date, talk_time, duration_minutes,
-                creator, modifier
-            ) VALUES (
-                $1, $2, $3, $4, $5::paper_type,
-                $6, $7, $8, $9, $10,
-                $11, $12, $13, $14, $15,
-                'import_from_csv', 'import_from_csv'
-            ) RETURNING id
-            """,
+        publication_id = await statements.insert_publication.fetchval(
             conference_id, canonical_key, talk.get('title'), talk.get('abstract') or None, talk.get('paper_type'),
             arxiv_ids, talk.get('session_name') or None, talk.get('presentation_url') or None,
             talk.get('video_url') or None, talk.get('youtube_id') or None,
-            talk.get('award') or None, json.dumps(enriched_metadata),
-            talk_date, talk_time, duration_minutes
+            talk.get('award') or None, metadata_json,
+            talk_date, talk_time, duration_minutes, import_hash
         )
         logger.info(f"Created publication: {talk.get('title')}")
 
-    # Clear existing authorships (for updates)
-    await conn.execute(
-        "DELETE FROM authorships WHERE publication_id = $1",
-        publication_id
-    )
-
-    # Create authorships
+    # Resolve authors, then write all authorships at once
     name_to_author_id = {}
+    authorship_rows = []
     for idx, author_name in enumerate(authors, start=1):
         # Get affiliation for this author position
         affiliation = None
@@ -257,52 +403,249 @@ async def import_talk(
             affiliation = affiliations[idx - 1]
 
         # Get or create author
-        author_id = await get_or_create_author(conn, author_name, affiliation)
-        name_to_author_id[normalize_name(author_name).lower()] = author_id
-
-        # Create authorship
-        await conn.execute(
-            """
-            INSERT INTO authorships (
-                publication_id, author_id, author_position, published_as_name, affiliation,
-                metadata, creator, modifier
-            ) VALUES (
-                $1, $2, $3, $4, $5, $6, 'import_from_csv', 'import_from_csv'
-            )
-            """,
-            publication_id, author_id, idx, author_name, affiliation, json.dumps(enriched_metadata)
+        author_id = await get_or_create_author(statements, author_name, affiliation)
+        name_to_author_id[normalize_name(author_name)] = author_id
+        authorship_rows.append(
+            (publication_id, author_id, idx, author_name, affiliation, metadata_json)
         )
 
+    columns = list(zip(*authorship_rows))
+    await statements.delete_stale_authorships.fetch([publication_id], *columns[:3])
+    await statements.upsert_authorships.fetch(*columns)
+
     # Set the presenter from the `speakers` column. Only a single speaker can be
     # represented (presenter_author_id is single-valued); the speaker must be one
     # of the talk's authors (DB trigger enforces this). Always written so re-imports
     # stay idempotent — resolves to NULL when there is no unambiguous speaker.
     presenter_id = None
     if speakers and len(speakers) == 1:
-        presenter_id = name_to_author_id.get(normalize_name(speakers[0]).lower())
+        presenter_id = name_to_author_id.get(normalize_name(speakers[0]))
         if presenter_id is None:
             logger.debug(
-                f"Speaker '{speakers[0]}' not among authors of '{talk.get('title')}'"
+                "Speaker '%s' not among authors of '%s'", speakers[0], talk.get('title')
             )
-    await conn.execute(
-        "UPDATE publications SET presenter_author_id = $1 WHERE id = $2",
-        presenter_id, publication_id
-    )
+    await statements.set_presenter.fetch(presenter_id, publication_id)
 
     logger.info(f"Imported: {talk.get('title')} with {len(authors)} author(s)")
     return True
 
 
+# The batch path COPYs every talk of a file into this staging table, then
+# inserts the new publications and updates the existing ones from it.
+_CREATE_STAGING_SQL = """
+    CREATE TEMP TABLE talk_import (
+        id UUID, is_new BOOLEAN, canonical_key TEXT, title TEXT, abstract TEXT,
+        paper_type TEXT, arxiv_ids TEXT[], session_name TEXT, presentation_url TEXT,
+        video_url TEXT, youtube_id TEXT, award TEXT, metadata JSONB,
+        talk_date DATE, talk_time TIME, duration_minutes INT, import_hash BYTEA
+    )
+"""
+_STAGING_COLUMNS = [
+    'id', 'is_new', 'canonical_key', 'title', 'abstract', 'paper_type', 'arxiv_ids',
+    'session_name', 'presentation_url', 'video_url', 'youtube_id', 'award', 'metadata',
+    'talk_date', 'talk_time', 'duration_minutes', 'import_hash'
+]
+
+_INSERT_PUBLICATIONS_SQL = """
+    INSERT INTO publications (
+        id, conference_id, canonical_key, title, abstract, paper_type,
+        arxiv_ids, session_name, presentation_url, video_url, youtube_id,
+        award, metadata, talk_date, talk_time, duration_minutes, import_hash,
+        creator, modifier
+    )
+    SELECT id, $1, canonical_key, title, abstract, paper_type::paper_type,
+           arxiv_ids, session_name, presentation_url, video_url, youtube_id,
+           award, metadata, talk_date, talk_time, duration_minutes, import_hash,
+           'import_from_csv', 'import_from_csv'
+    FROM talk_import WHERE is_new
+"""
+
+_UPDATE_PUBLICATIONS_SQL = """
+    UPDATE publications p
+    SET title = t.title, abstract = t.abstract, paper_type = t.paper_type::paper_type,
+        arxiv_ids = t.arxiv_ids, session_name = t.session_name, presentation_url = t.presentation_url,
+        video_url = t.video_url, youtube_id = t.youtube_id, award = t.award,
+        metadata = t.metadata, talk_date = t.talk_date, talk_time = t.talk_time,
+        duration_minutes = t.duration_minutes, import_hash = t.import_hash,
+        updated_at = NOW(), modifier = 'import_from_csv'
+    FROM talk_import t
+    WHERE p.id = t.id AND NOT t.is_new
+"""
+
+# Both paths rewrite a publication's byline in place: rows whose position
+# now holds a different author (or no author) are deleted, the rest are
+# upserted by position. Unchanged authorships keep their IDs, and a
+# re-import of an unchanged byline only touches rows whose fields differ;
+# scraped_date is new on every run, so the metadata comparison ignores it.
+# Parameters are parallel arrays of publication ID, author ID, position,
+# then (for the upsert) name as written, affiliation and metadata.
+_DELETE_STALE_AUTHORSHIPS_SQL = """
+    DELETE FROM authorships a
+    WHERE a.publication_id = ANY($1::uuid[])
+      AND NOT EXISTS (
+          SELECT 1 FROM unnest($2::uuid[], $3::uuid[], $4::int[]) AS u(publication_id, author_id, author_position)
+          WHERE u.publication_id = a.publication_id
+            AND u.author_id = a.author_id
+            AND u.author_position = a.author_position
+      )
+"""
+
+# After the delete, a conflicting row already has the right author_id
+_UPSERT_AUTHORSHIPS_SQL = """
+    INSERT INTO authorships (
+        publication_id, author_id, author_position, published_as_name, affiliation,
+        metadata, creator, modifier
+    )
+    SELECT u.publication_id, u.author_id, u.author_position, u.published_as_name, u.affiliation,
+           u.metadata::jsonb, 'import_from_csv', 'import_from_csv'
+    FROM unnest($1::uuid[], $2::uuid[], $3::int[], $4::text[], $5::text[], $6::text[])
+        AS u(publication_id, author_id, author_position, published_as_name, affiliation, metadata)
+    ON CONFLICT (publication_id, author_position) DO UPDATE
+    SET published_as_name = EXCLUDED.published_as_name, affiliation = EXCLUDED.affiliation,
+        metadata = EXCLUDED.metadata, updated_at = NOW(), modifier = 'import_from_csv'
+    WHERE (authorships.published_as_name, authorships.affiliation,
+           authorships.metadata - 'scraped_date')
+        IS DISTINCT FROM (EXCLUDED.published_as_name, EXCLUDED.affiliation,
+                          EXCLUDED.metadata - 'scraped_date')
+"""
+
+_SET_PRESENTERS_SQL = """
+    UPDATE publications p
+    SET presenter_author_id = u.presenter_author_id
+    FROM unnest($1::uuid[], $2::uuid[]) AS u(id, presenter_author_id)
+    WHERE p.id = u.id
+"""
+
+
+async def import_talks_batch(
+    conn: asyncpg.Connection,
+    conference_id: UUID,
+    year: int,
+    talks: List[tuple[str, Dict[str, str], Dict, Optional[List[str]], List[str]]],
+    csv_filename: str,
+    known_authors: Dict[str, UUID]
+) -> Dict[str, UUID]:
+    """Import talks with set-based statements.
+
+    ``talks`` holds ``(canonical_key, talk, source_metadata, speakers,
+    authors)`` tuples, the lists already parsed from the CSV row.
+
+    Does what ``import_talk`` does for each talk, but publications go through
+    one COPY into a staging table and authorships through two array-based
+    statements, instead of a few round trips per row. Talks whose row is
+    unchanged since the last import are skipped. Every talk must have
+    authors. Raises on the first database error; the caller falls back to
+    ``import_talk``.
+
+    ``known_authors`` maps normalized names to author IDs resolved by earlier
+    files. Returns the author IDs this file resolved to, by normalized name.
+    """
+    existing = {
+        row['canonical_key']: (row['id'], row['import_hash'])
+        for row in await conn.fetch(
+            "SELECT canonical_key, id, import_hash FROM publications WHERE canonical_key = ANY($1::text[])",
+            [canonical_key for canonical_key, *_ in talks]
+        )
+    }
+
+    staged = []
+    bylines = []
+    people = []
+    for canonical_key, talk, source_metadata, speakers, authors in talks:
+        import_hash = talk_import_hash(conference_id, talk, csv_filename)
+        publication_id, stored_hash = existing.get(canonical_key) or (uuid4(), None)
+        if stored_hash == import_hash:
+            logger.info(f"Unchanged: {talk.get('title')}")
+            continue
+
+        affiliations = parse_semicolon_list(talk.get('affiliations', ''))
+        metadata = json.dumps({**source_metadata, 'csv_file': csv_filename})
+
+        staged.append((
+            publication_id, canonical_key not in existing, canonical_key,
+            talk.get('title'), talk.get('abstract') or None, talk.get('paper_type'),
+            parse_semicolon_list(talk.get('arxiv_ids', '')), talk.get('session_name') or None,
+            talk.get('presentation_url') or None, talk.get('video_url') or None,
+            talk.get('youtube_id') or None, talk.get('award') or None, metadata,
+            *parse_schedule(talk, year), import_hash
+        ))
+
+        # (normalized name, name as written, affiliation) per author position
+        byline = []
+        for idx, author_name in enumerate(authors, start=1):
+            affiliation = None
+            if affiliations and len(affiliations) >= idx:
+                affiliation = affiliations[idx - 1]
+            byline.append((normalize_name(author_name), author_name, affiliation))
+        bylines.append((publication_id, metadata, talk.get('title'), speakers, byline))
+        people.extend(byline)
+
+    author_ids = await resolve_authors(conn, people, known_authors)
+
+    authorships = []
+    presenter_ids = []
+    for publication_id, metadata, title, speakers, byline in bylines:
+        for idx, (name, author_name, affiliation) in enumerate(byline, start=1):
+            authorships.append((
+                publication_id, author_ids[name], idx, author_name, affiliation, metadata
+            ))
+
+        presenter_id = None
+        if speakers and len(speakers) == 1:
+            speaker = normalize_name(speakers[0])
+            if any(name == speaker for name, _, _ in byline):
+                presenter_id = author_ids[speaker]
+            else:
+                logger.debug(
+                    "Speaker '%s' not among authors of '%s'", speakers[0], title
+                )
+        presenter_ids.append(presenter_id)
+
+    await conn.execute(_CREATE_STAGING_SQL)
+    await conn.copy_records_to_table('talk_import', records=staged, columns=_STAGING_COLUMNS)
+    await conn.execute(_UPDATE_PUBLICATIONS_SQL)
+    await conn.execute(_INSERT_PUBLICATIONS_SQL, conference_id)
+
+    # Rewrite the bylines of every publication in the file
+    publication_ids = [row[0] for row in staged]
+    columns = list(zip(*authorships)) or [()] * 6
+    await conn.execute(_DELETE_STALE_AUTHORSHIPS_SQL, publication_ids, *columns[:3])
+    await conn.execute(_UPSERT_AUTHORSHIPS_SQL, *columns)
+
+    # Presenters last: the trigger checks them against the new authorships
+    await conn.execute(_SET_PRESENTERS_SQL, publication_ids, presenter_ids)
+    await conn.execute("DROP TABLE talk_import")
+
+    for (_, is_new, *_), (_, _, title, _, byline) in zip(staged, bylines):
+        if is_new:
+            logger.info(f"Created publication: {title}")
+        logger.info(f"Imported: {title} with {len(byline)} author(s)")
+
+    return author_ids
+
+
 async def import_from_csv(
     pool: asyncpg.Pool,
     csv_file: Path,
-    dry_run: bool = False
+    dry_run: bool = False,
+    known_authors: Optional[Dict[str, UUID]] = None
 ) -> tuple[int, list[dict]]:
-    """Import talks from CSV. Returns (imported_count, list of failure dicts)."""
+    """Import talks from CSV. Returns (imported_count, list of failure dicts).
+
+    The file is imported with ``import_talks_batch``. If that fails, the
+    file is imported again talk by talk, each in its own savepoint, so the
+    talks that fail can be reported one by one.
+
+    ``known_authors`` memoizes author IDs by normalized name across the files
+    of a run; speakers recur from one year's program to the next. Only IDs
+    from committed imports are added to it.
+    """
+    if known_authors is None:
+        known_authors = {}
 
-    # Read CSV
+    # Read CSV; the 1 MiB buffer takes a typical talks file in one read
     talks = []
-    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+    with open(csv_file, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
         reader = csv.DictReader(f)
         talks = list(reader)
 
@@ -326,32 +669,81 @@ async def import_from_csv(
     imported = 0
     failures = []
 
-    # Group by paper_type for canonical_key generation
-    talks_by_type = {}
+    # One pass for the canonical_key (numbered within each paper_type), the
+    # source metadata and the speaker/author lists. Talks are imported
+    # grouped by paper_type.
+    scraped_date = datetime.now().isoformat()
+    talks_by_type: Dict[str, list] = {}
     for talk in talks:
         paper_type = talk.get('paper_type', 'invited')
-        if paper_type not in talks_by_type:
-            talks_by_type[paper_type] = []
-        talks_by_type[paper_type].append(talk)
+        type_talks = talks_by_type.setdefault(paper_type, [])
+        source_metadata = {
+            'source_type': 'conference_website',
+            'source_url': talk.get('notes', ''),
+            'scraped_date': scraped_date,
+            'notes': f'Imported from CSV'
+        }
+        speakers = parse_semicolon_list(talk.get('speakers', ''))
+        type_talks.append((
+            paper_type,
+            generate_canonical_key(venue, year, paper_type, len(type_talks) + 1),
+            talk,
+            source_metadata,
+            speakers,
+            parse_semicolon_list(talk.get('authors', '')) or speakers,
+        ))
+    keyed_talks = [entry for type_talks in talks_by_type.values() for entry in type_talks]
 
     async with pool.acquire() as conn:
-        # Per-talk savepoints (inside one outer transaction) so a single bad
-        # row doesn't poison the rest of the file — postgres otherwise aborts
-        # the whole transaction on any constraint failure.
         async with conn.transaction():
-            for paper_type, type_talks in talks_by_type.items():
-                for idx, talk in enumerate(type_talks, start=1):
-                    canonical_key = generate_canonical_key(venue, year, paper_type, idx)
-                    source_metadata = {
-                        'source_type': 'conference_website',
-                        'source_url': talk.get('notes', ''),
-                        'scraped_date': datetime.now().isoformat(),
-                        'notes': f'Imported from CSV'
-                    }
+            # Every talk in a file shares one conference
+            conference_id = await get_conference_id(conn, venue, year)
+            author_ids = None
+            if not conference_id:
+                logger.error(f"Conference not found: {venue} {year}")
+                failures.extend({
+                    'file': csv_file.name,
+                    'title': talk.get('title', '(no title)'),
+                    'paper_type': paper_type,
+                    'reason': 'import_talk returned False (conference not found or no authors)',
+                } for paper_type, _, talk, _, _, _ in keyed_talks)
+            else:
+                await conn.execute(_LOCK_CONFERENCE_SQL, conference_id)
+                # Fast path: the whole file in a few set-based statements
+                with_authors = []
+                for paper_type, canonical_key, talk, source_metadata, speakers, authors in keyed_talks:
+                    if authors:
+                        with_authors.append((canonical_key, talk, source_metadata, speakers, authors))
+                    else:
+                        logger.warning(f"No authors for talk: {talk.get('title', 'unknown')}")
+                        failures.append({
+                            'file': csv_file.name,
+                            'title': talk.get('title', '(no title)'),
+                            'paper_type': paper_type,
+                            'reason': 'import_talk returned False (conference not found or no authors)',
+                        })
+                try:
+                    async with conn.transaction():  # savepoint
+                        author_ids = await import_talks_batch(
+                            conn, conference_id, year, with_authors, csv_file.name, known_authors
+                        )
+                    imported = len(with_authors)
+                except Exception as e:
+                    logger.warning(f"Batch import failed ({e}); importing talk by talk")
+                    failures = []
+
+            if conference_id and author_ids is None:
+                # Per-talk savepoints (inside one outer transaction) so a single bad
+                # row doesn't poison the rest of the file — postgres otherwise aborts
+                # the whole transaction on any constraint failure.
+                statements = await TalkStatements.prepare(conn)
+                # get_or_create_author may insert at any talk
+                await conn.execute(_LOCK_AUTHORS_SQL)
+                for paper_type, canonical_key, talk, source_metadata, _, _ in keyed_talks:
                     try:
                         async with conn.transaction():  # savepoint
                             success = await import_talk(
-                                conn, venue, year, talk, canonical_key, source_metadata, csv_file.name
+                                statements, conference_id, year, talk, canonical_key, source_metadata, csv_file.name
                             )
                         if success:
                             imported += 1
@@ -371,6 +763,8 @@ async def import_from_csv(
                         })
                         logger.error(f"Error importing '{talk.get('title', 'unknown')}': {e}")
 
+    if author_ids is not None:
+        known_authors.update(author_ids)
     return imported, failures
 
 
@@ -381,6 +775,8 @@ def add_arguments(parser):
                         help='Show what would be imported without making changes')
     parser.add_argument('--db-url', type=str,
                         help='Database URL (overrides DATABASE_URL env var)')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Number of CSV files to import in parallel, one connection each (default: 1)')
 
 
 async def async_main(args) -> int:
@@ -393,6 +789,7 @@ async def async_main(args) -> int:
             return 1
         csv_files.append(p)
 
+    jobs = max(1, min(args.jobs, len(csv_files)))
     pool = None
     if not args.dry_run:
         load_dotenv()
@@ -401,22 +798,31 @@ async def async_main(args) -> int:
             logger.error("DATABASE_URL not set. Set it in .env file or use --db-url")
             return 1
         try:
-            pool = await asyncpg.create_pool(database_url)
+            pool = await asyncpg.create_pool(database_url, min_size=jobs, max_size=jobs)
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             return 1
 
     total_imported = 0
     all_failures: list[dict] = []
+    known_authors: Dict[str, UUID] = {}
 
     try:
-        for csv_file in csv_files:
-            if len(csv_files) > 1:
-                logger.info(f"\n--- Processing {csv_file.name} ---")
+        pending = deque(csv_files)
+
+        # Each file is one transaction on its own pool connection
+        async def worker() -> None:
+            nonlocal total_imported
+            while pending:
+                csv_file = pending.popleft()
+                if len(csv_files) > 1:
+                    logger.info(f"\n--- Processing {csv_file.name} ---")
+
+                imported, failures = await import_from_csv(pool, csv_file, args.dry_run, known_authors)
+                total_imported += imported
+                all_failures.extend(failures)
 
-            imported, failures = await import_from_csv(pool, csv_file, dry_run=args.dry_run)
-            total_imported += imported
-            all_failures.extend(failures)
+        await asyncio.gather(*(worker() for _ in range(jobs if pool is not None else 1)))
 
         if args.dry_run:
             logger.info(f"\nDRY RUN complete. Would import {total_imported} talks across {len(csv_files)} file(s).")
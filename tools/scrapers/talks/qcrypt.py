@@ -15,6 +15,7 @@ import re
 from datetime import date, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..base import BODY_ONLY
 from .base import BaseTalkScraper
 
 logger = logging.getLogger(__name__)
@@ -39,8 +40,11 @@ QCRYPT_START_DATES: Dict[int, date] = {
     2024: date(2024, 9, 2),
 }
 
-DAY_NAMES = ['monday', 'tuesday', 'wednesday', 'thursday',
-             'friday', 'saturday', 'sunday']
+DAY_NAMES = ('monday', 'tuesday', 'wednesday', 'thursday',
+             'friday', 'saturday', 'sunday')
+# One group per day inside a lookahead, so finditer sees every day named
+# and m.lastindex gives its DAY_NAMES position
+_DAY_RE = re.compile('(?=' + '|'.join(f'({name})' for name in DAY_NAMES) + ')')
 
 NON_TALK_KEYWORDS = (
     'coffee', 'lunch', 'break', 'registration', 'reception',
@@ -51,6 +55,7 @@ NON_TALK_KEYWORDS = (
     'check-in', 'group photo', 'awards ceremony', 'best paper',
     'q&a', 'networking', 'space-quest',
 )
+_NON_TALK_RE = re.compile('|'.join(map(re.escape, NON_TALK_KEYWORDS)))
 
 
 _TRAILING_LINK_TEXT_RE = re.compile(
@@ -76,17 +81,15 @@ def _is_non_talk(text: str) -> bool:
     lower = text.strip().lower()
     if not lower:
         return True
-    return any(kw in lower for kw in NON_TALK_KEYWORDS)
+    return _NON_TALK_RE.search(lower) is not None
 
 
 def _day_index(day_name: str) -> Optional[int]:
     if not day_name:
         return None
-    lower = day_name.strip().lower()
-    for idx, name in enumerate(DAY_NAMES):
-        if name in lower:
-            return idx
-    return None
+    # Earliest day in DAY_NAMES wins, not the first one in the text
+    matched = {m.lastindex for m in _DAY_RE.finditer(day_name.lower())}
+    return min(matched) - 1 if matched else None
 
 
 def _normalize_time(text: str) -> Optional[str]:
@@ -110,6 +113,9 @@ def _strip_arxiv_link_text(text: str) -> List[str]:
 class QCryptTalkScraper(BaseTalkScraper):
     """Scraper for QCrypt schedule pages, all eras."""
 
+    # The era parsers look at different tags, so only <head> is skipped
+    parse_only = BODY_ONLY
+
     def get_url(self) -> str:
         """Return the canonical archive URL for the year's schedule page."""
         if self.year < 2011:
@@ -1,11 +1,20 @@
 """QIP conference talk scraper."""
+import re
 from typing import List, Dict, Any
+
+from bs4 import SoupStrainer
+
 from .base import BaseTalkScraper
 
+# Words that mark a date heading rather than a talk title
+_DATE_WORD_RE = re.compile('January|Saturday|Sunday|Monday|Tuesday|Wednesday|Thursday|Friday')
+
 
 class QIPTalkScraper(BaseTalkScraper):
     """Scraper for QIP invited/tutorial talks."""
 
+    parse_only = SoupStrainer('div', class_='ce-bodytext')
+
     def get_url(self) -> str:
         """Return the URL for the QIP program/schedule page."""
         # QIP 2026 has tutorials
@@ -65,29 +74,23 @@ class QIPTalkScraper(BaseTalkScraper):
                 
                 # Parse speaker and affiliation from paragraph with <br>
                 if br_tags and strong_tags:
-                    # Get HTML content
-                    html = str(p)
-                    import re
-                    parts = re.split(r'<br\s*/?>', html)
+                    # Speaker name is the <strong> before the first <br>
+                    for node in p.descendants:
+                        if node.name == 'br':
+                            break
+                        if node.name == 'strong':
+                            current_speaker = self.normalize_name(self.split_at_br(node)[0])
+                            break
                     
-                    if len(parts) >= 2:
-                        # First part has speaker name
-                        from bs4 import BeautifulSoup
-                        speaker_soup = BeautifulSoup(parts[0], 'html.parser')
-                        speaker_strong = speaker_soup.find('strong')
-                        if speaker_strong:
-                            current_speaker = speaker_strong.get_text(strip=True)
-                        
-                        # Second part has affiliation
-                        affil_soup = BeautifulSoup(parts[1], 'html.parser')
-                        current_affiliation = affil_soup.get_text(strip=True)
+                    # Affiliation follows it
+                    current_affiliation = self.normalize_affiliation(self.split_at_br(p)[1])
                     continue
                 
                 # Check for talk title (paragraph with only <strong> tag)
                 if strong_tags and len(strong_tags) == 1 and not br_tags:
                     potential_title = strong_tags[0].get_text(strip=True)
                     # Skip if it's empty, a date, or very short
-                    if potential_title and len(potential_title) > 3 and not any(word in potential_title for word in ['January', 'Saturday', 'Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']):
+                    if potential_title and len(potential_title) > 3 and not _DATE_WORD_RE.search(potential_title):
                         current_title = potential_title
                     continue
                 
@@ -5,7 +5,7 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from .._lib import get_archive_url, url_to_local_path
+from .._lib import close_pool, get_archive_url, url_to_local_path
 from . import QCryptTalkScraper, QIPTalkScraper, TQCTalkScraper
 
 logger = logging.getLogger(__name__)
@@ -27,6 +27,17 @@ def serialize_list(items: Optional[List[str]]) -> str:
     return ';'.join(str(item) for item in items if item)
 
 
+_LIST_FIELDS = frozenset({'speakers', 'authors', 'affiliations', 'arxiv_ids'})
+
+
+def _csv_value(talk: Dict[str, Any], field: str) -> Any:
+    """One CSV cell of ``talk``; list fields are joined with ';'."""
+    value = talk.get(field)
+    if field in _LIST_FIELDS and isinstance(value, list):
+        return serialize_list(value)
+    return value
+
+
 def save_to_csv(venue: str, year: int, talks: List[Dict[str, Any]],
                 output_dir: Path, force: bool = False) -> Optional[Path]:
     """Save scraped talks to ``<output_dir>/<venue>_<year>/talks.csv``."""
@@ -40,24 +51,20 @@ def save_to_csv(venue: str, year: int, talks: List[Dict[str, Any]],
         logger.warning("Use --force to overwrite")
         return None
 
-    for talk in talks:
-        talk['venue'] = venue.upper()
-        talk['year'] = year
-        for list_field in ['speakers', 'authors', 'affiliations', 'arxiv_ids']:
-            if list_field in talk and isinstance(talk[list_field], list):
-                talk[list_field] = serialize_list(talk[list_field])
-
-    fieldnames = [
+    fieldnames = (
         'venue', 'year', 'paper_type', 'title', 'speakers', 'authors',
         'affiliations', 'abstract', 'arxiv_ids', 'presentation_url',
         'video_url', 'youtube_id', 'session_name', 'award', 'notes',
         'scheduled_date', 'scheduled_time', 'duration_minutes',
-    ]
+    )
+    venue = venue.upper()
+    rows = [(venue, year) + tuple(_csv_value(talk, field) for field in fieldnames[2:])
+            for talk in talks]
 
-    with open(output_file, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(talks)
+    with open(output_file, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
 
     logger.info(f"Saved {len(talks)} talks to {output_file}")
 
@@ -92,25 +99,34 @@ def add_arguments(parser: argparse.ArgumentParser) -> None:
 
 async def async_main(args: argparse.Namespace) -> int:
     """Run the talk scrape end-to-end. Returns shell exit code."""
+    try:
+        return await _scrape(args)
+    finally:
+        await close_pool()
+
+
+async def _scrape(args: argparse.Namespace) -> int:
     local_dir = Path(args.local_dir).expanduser()
     output_dir = Path(args.output_dir)
 
-    archive_url = await get_archive_url(args.venue, args.year, ['archive_program_url'])
     scraper_class = _VENUES[args.venue.upper()]
 
     local_file = None
     if args.local:
         if args.local_file:
             local_file = args.local_file
-        elif archive_url:
-            local_file = url_to_local_path(archive_url, local_dir)
         else:
-            try:
-                default_url = scraper_class(year=args.year).get_url()
-                local_file = url_to_local_path(default_url, local_dir)
-            except NotImplementedError:
-                logger.error(f"No default URL for {args.venue} {args.year} and no archive URL in database")
-                return 1
+            # The archive URL is only used to find the page in the local mirror
+            archive_url = await get_archive_url(args.venue, args.year, ['archive_program_url'])
+            if archive_url:
+                local_file = url_to_local_path(archive_url, local_dir)
+            else:
+                try:
+                    default_url = scraper_class(year=args.year).get_url()
+                    local_file = url_to_local_path(default_url, local_dir)
+                except NotImplementedError:
+                    logger.error(f"No default URL for {args.venue} {args.year} and no archive URL in database")
+                    return 1
 
         if local_file:
             logger.info(f"Using local file: {local_file}")